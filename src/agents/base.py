@@ -110,6 +110,22 @@ class BaseAgent(ABC):
         updated_history = f"{current_history}\n{self.name}: {message}".strip()
         return updated_history
 
+    def append_to_history(self, state: GraphState, *turns: str) -> str:
+        """
+        Append one or more formatted turns to the conversation history.
+
+        All turns are joined in a single pass so adding an exchange copies
+        the existing history once rather than once per turn.
+
+        Args:
+            state: Current graph state
+            *turns: Turns to append (e.g. "Assistant: ...", "User: ...")
+
+        Returns:
+            Updated conversation history
+        """
+        return "\n".join((state.get("conversation_history", ""), *turns))
+
     def get_task(self, state: GraphState) -> str:
         """
         Get the task assigned to this agent.
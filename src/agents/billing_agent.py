@@ -5,7 +5,11 @@ from src.agents.base import BaseAgent
 from src.agents.prompts import BILLING_AGENT_PROMPT
 from src.graph.state import GraphState
 from src.utils.llm_client import get_llm_client
-from src.tools.billing_tools import get_billing_info, get_payment_history
+from src.tools.billing_tools import (
+    get_billing_and_payments,
+    get_billing_info,
+    get_payment_history,
+)
 
 
 class BillingAgent(BaseAgent):
@@ -73,6 +77,20 @@ class BillingAgent(BaseAgent):
                     },
                 },
             },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_billing_and_payments",
+                    "description": "Retrieve billing information and recent payment history together in one call; prefer this when both are needed for a policy",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "policy_number": {"type": "string"}
+                        },
+                        "required": ["policy_number"],
+                    },
+                },
+            },
         ]
 
         # Execute with LLM
@@ -83,6 +101,7 @@ class BillingAgent(BaseAgent):
             tool_functions={
                 "get_billing_info": get_billing_info,
                 "get_payment_history": get_payment_history,
+                "get_billing_and_payments": get_billing_and_payments,
             },
         )
 
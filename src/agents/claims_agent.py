@@ -5,7 +5,7 @@ from src.agents.base import BaseAgent
 from src.agents.prompts import CLAIMS_AGENT_PROMPT
 from src.graph.state import GraphState
 from src.utils.llm_client import get_llm_client
-from src.tools.claims_tools import get_claim_status
+from src.tools.claims_tools import get_claim_status, get_claims_by_policies
 
 
 class ClaimsAgent(BaseAgent):
@@ -58,7 +58,24 @@ class ClaimsAgent(BaseAgent):
                         },
                     },
                 },
-            }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_claims_by_policies",
+                    "description": "Retrieve recent claims for several policy numbers in one call",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "policy_numbers": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            }
+                        },
+                        "required": ["policy_numbers"],
+                    },
+                },
+            },
         ]
 
         # Execute with LLM
@@ -66,7 +83,10 @@ class ClaimsAgent(BaseAgent):
         result = self.llm_client.run_llm(
             prompt,
             tools=tools,
-            tool_functions={"get_claim_status": get_claim_status},
+            tool_functions={
+                "get_claim_status": get_claim_status,
+                "get_claims_by_policies": get_claims_by_policies,
+            },
         )
 
         self.logger.info("✅ Claims agent completed")
@@ -5,7 +5,12 @@ from src.agents.base import BaseAgent
 from src.agents.prompts import POLICY_AGENT_PROMPT
 from src.graph.state import GraphState
 from src.utils.llm_client import get_llm_client
-from src.tools.policy_tools import get_policy_details, get_auto_policy_details
+from src.tools.policy_tools import (
+    get_auto_policy_details,
+    get_full_auto_policy,
+    get_policy_details,
+    get_policy_details_many,
+)
 
 
 class PolicyAgent(BaseAgent):
@@ -59,6 +64,23 @@ class PolicyAgent(BaseAgent):
                     },
                 },
             },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_policy_details_many",
+                    "description": "Fetch policy info for several policy numbers in one call",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "policy_numbers": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            }
+                        },
+                        "required": ["policy_numbers"],
+                    },
+                },
+            },
             {
                 "type": "function",
                 "function": {
@@ -73,6 +95,20 @@ class PolicyAgent(BaseAgent):
                     },
                 },
             },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_full_auto_policy",
+                    "description": "Get policy info and auto policy details together in one call; prefer this over calling get_policy_details and get_auto_policy_details separately",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "policy_number": {"type": "string"}
+                        },
+                        "required": ["policy_number"],
+                    },
+                },
+            },
         ]
 
         # Execute with LLM
@@ -82,7 +118,9 @@ class PolicyAgent(BaseAgent):
             tools=tools,
             tool_functions={
                 "get_policy_details": get_policy_details,
+                "get_policy_details_many": get_policy_details_many,
                 "get_auto_policy_details": get_auto_policy_details,
+                "get_full_auto_policy": get_full_auto_policy,
             },
         )
 
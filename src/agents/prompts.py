@@ -77,7 +77,9 @@ Responsibilities:
 
 Tools:
 - get_policy_details
+- get_policy_details_many (several policies at once)
 - get_auto_policy_details
+- get_full_auto_policy (policy and auto details at once)
 
 Context:
 - Policy Number: {policy_number}
@@ -110,6 +112,7 @@ Instructions:
 Tools:
 - get_billing_info
 - get_payment_history
+- get_billing_and_payments (billing and payment history at once)
 
 Context:
 - Conversation History: {conversation_history}
@@ -129,6 +132,7 @@ Responsibilities:
 
 Tools:
 - get_claim_status
+- get_claims_by_policies (several policies at once)
 
 Context:
 - Policy Number: {policy_number}
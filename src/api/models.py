@@ -76,6 +76,26 @@ class ChatResponse(BaseModel):
     )
 
 
+class ClarificationRequest(BaseModel):
+    """Request model for answering a pending clarification question."""
+
+    answer: str = Field(
+        ...,
+        min_length=1,
+        max_length=2000,
+        description="User's answer to the clarification question",
+        examples=["My policy number is POL000004"],
+    )
+
+
+class ClarificationResponse(BaseModel):
+    """Response model for a pending clarification question."""
+
+    session_id: str = Field(..., description="Session identifier")
+    question: str = Field(..., description="Question the system is waiting on")
+    missing_info: str = Field("", description="What information is missing")
+
+
 # ============================================================================
 # Session API Models
 # ============================================================================
@@ -2,15 +2,22 @@
 Chat endpoints for multi-agent conversation.
 """
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 import uuid
 import time
 
-from src.api.models import ChatRequest, ChatResponse
+from src.api.models import (
+    ChatRequest,
+    ChatResponse,
+    ClarificationRequest,
+    ClarificationResponse,
+)
 from src.graph.workflow import get_workflow
 from src.graph.state import create_initial_state
 from src.session.manager import get_session_manager
 from src.session.models import MessageRole
+from src.tools.user_interaction import get_pending_clarification, submit_clarification
 from src.observability.logging_config import get_logger
 from src.observability import metrics
 from src.config import settings
@@ -124,7 +131,9 @@ async def chat(
             extra={"request_id": request_id, "session_id": session_id},
         )
 
-        result = workflow.invoke(initial_state)
+        # Run the synchronous workflow in a worker thread so the event loop
+        # keeps serving other requests (including clarification answers)
+        result = await run_in_threadpool(workflow.invoke, initial_state)
 
         # Track conversation metrics
         duration = time.time() - start_time
@@ -249,6 +258,68 @@ async def chat(
         )
 
 
+@router.get("/chat/{session_id}/clarification", response_model=ClarificationResponse)
+async def get_clarification(session_id: str):
+    """
+    Get the clarification question a running chat request is waiting on.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        The pending question
+
+    Raises:
+        HTTPException: If the session has no pending question
+    """
+    pending = get_pending_clarification(session_id)
+    if pending is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=(
+                f"No pending clarification for session {session_id}; "
+                "it may have timed out or already been answered"
+            ),
+        )
+
+    return ClarificationResponse(
+        session_id=session_id,
+        question=pending.question,
+        missing_info=pending.missing_info,
+    )
+
+
+@router.post("/chat/{session_id}/clarify")
+async def clarify(session_id: str, request: ClarificationRequest):
+    """
+    Answer the clarification question a running chat request is waiting on.
+
+    The waiting chat request resumes with this answer and returns its
+    response as usual.
+
+    Args:
+        session_id: Session identifier
+        request: The user's answer
+
+    Returns:
+        Acknowledgement
+
+    Raises:
+        HTTPException: If the session has no pending question
+    """
+    if not submit_clarification(session_id, request.answer):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=(
+                f"No pending clarification for session {session_id}; "
+                "it may have timed out or already been answered"
+            ),
+        )
+
+    logger.info(f"Clarification received for session {session_id}")
+    return {"session_id": session_id, "status": "accepted"}
+
+
 @router.get("/chat/test")
 async def test_chat():
     """
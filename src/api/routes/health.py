@@ -23,9 +23,7 @@ def check_database() -> ServiceStatus:
         from src.database.connection import connect_db
 
         conn = connect_db()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
+        conn.execute("SELECT 1").fetchone()
         conn.close()
 
         duration_ms = (time.time() - start_time) * 1000
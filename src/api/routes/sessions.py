@@ -4,10 +4,13 @@ Provides CRUD operations for conversation sessions.
 """
 from fastapi import APIRouter, HTTPException, status, Request
 from typing import List
+from datetime import datetime, timedelta
+
+import msgspec
 
 from src.api.models import SessionResponse, SessionListResponse, ConversationMessage
 from src.session.manager import get_session_manager
-from src.session.models import MessageRole
+from src.session.models import MessageRole, from_micros
 from src.observability.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -40,29 +43,31 @@ async def list_sessions(
     session_manager = get_session_manager()
     session_ids = session_manager.list_sessions(limit=limit)
 
-    # Get full session data for each ID
+    # Get full session data for all IDs in one batch (read-only form)
     sessions = []
-    for session_id in session_ids:
-        session_state = session_manager.get_session(session_id)
-        if session_state:
-            # Convert to API response format
-            messages = [
-                ConversationMessage(
-                    role=msg.role.value,
-                    content=msg.content,
-                    timestamp=msg.timestamp,
-                )
-                for msg in session_state.messages
-            ]
-
-            session_response = SessionResponse(
-                session_id=session_state.session_id,
-                created_at=session_state.created_at,
-                last_activity=session_state.last_activity,
-                messages=messages,
-                state=session_state.context.model_dump(exclude_none=True),
+    for session_state in session_manager.get_sessions_msg(session_ids):
+        # Convert to API response format
+        messages = [
+            ConversationMessage(
+                role=msg.role.value,
+                content=msg.content,
+                timestamp=from_micros(msg.timestamp),
             )
-            sessions.append(session_response)
+            for msg in session_state.messages
+        ]
+
+        session_response = SessionResponse(
+            session_id=session_state.session_id,
+            created_at=from_micros(session_state.created_at),
+            last_activity=from_micros(session_state.last_activity),
+            messages=messages,
+            state={
+                name: value
+                for name, value in msgspec.structs.asdict(session_state.context).items()
+                if value is not None
+            },
+        )
+        sessions.append(session_response)
 
     logger.info(f"Found {len(sessions)} sessions", extra={"request_id": request_id})
 
@@ -95,7 +100,7 @@ async def get_session(
     logger.info(f"Getting session: {session_id}", extra={"request_id": request_id, "session_id": session_id})
 
     session_manager = get_session_manager()
-    session_state = session_manager.get_session(session_id)
+    session_state = session_manager.get_session_msg(session_id)
 
     if not session_state:
         logger.warning(f"Session not found: {session_id}", extra={"request_id": request_id})
@@ -109,17 +114,21 @@ async def get_session(
         ConversationMessage(
             role=msg.role.value,
             content=msg.content,
-            timestamp=msg.timestamp,
+            timestamp=from_micros(msg.timestamp),
         )
         for msg in session_state.messages
     ]
 
     return SessionResponse(
         session_id=session_state.session_id,
-        created_at=session_state.created_at,
-        last_activity=session_state.last_activity,
+        created_at=from_micros(session_state.created_at),
+        last_activity=from_micros(session_state.last_activity),
         messages=messages,
-        state=session_state.context.model_dump(exclude_none=True),
+        state={
+            name: value
+            for name, value in msgspec.structs.asdict(session_state.context).items()
+            if value is not None
+        },
     )
 
 
@@ -195,15 +204,15 @@ async def refresh_session(
             detail=f"Session '{session_id}' not found",
         )
 
-    # Get updated session
-    session_state = session_manager.get_session(session_id)
+    # The refresh only extends the key TTL, so derive the new expiry here
+    expires_at = datetime.utcnow() + timedelta(seconds=session_manager.ttl_seconds)
 
     logger.info(f"✅ Session TTL refreshed: {session_id}", extra={"request_id": request_id})
 
     return {
         "message": f"Session '{session_id}' TTL refreshed",
         "session_id": session_id,
-        "expires_at": session_state.expires_at if session_state else None,
+        "expires_at": expires_at,
     }
 
 
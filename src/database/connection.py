@@ -5,6 +5,7 @@ Currently supports SQLite for development.
 Will be migrated to PostgreSQL for production.
 """
 import sqlite3
+import threading
 from contextlib import contextmanager
 from typing import Generator, Optional
 from pathlib import Path
@@ -15,6 +16,16 @@ from src.observability.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+# Secondary indexes for the tool queries' filter/join/sort columns. The
+# lookups by policy_number, claim_id and bill_id already hit primary keys.
+TOOL_QUERY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_policies_customer_id ON policies(customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_billing_policy_status_due ON billing(policy_number, status, due_date)",
+    "CREATE INDEX IF NOT EXISTS idx_payments_bill_date ON payments(bill_id, payment_date)",
+    "CREATE INDEX IF NOT EXISTS idx_claims_policy_date ON claims(policy_number, claim_date)",
+)
+
+
 class DatabaseManager:
     """
     Database connection manager.
@@ -46,6 +57,32 @@ class DatabaseManager:
             self._connection.row_factory = sqlite3.Row  # Enable dict-like access
         return self._connection
 
+    def prepare_for_queries(self) -> bool:
+        """
+        Apply the database-level settings and indexes the tools rely on.
+
+        Switches the file to WAL (readers run alongside a writer), creates
+        secondary indexes for the tool queries' filter/join/sort columns and
+        refreshes planner statistics. Run once at startup, after the
+        database has been populated; tool calls never change the schema.
+
+        Returns:
+            True if everything was applied
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                for statement in TOOL_QUERY_INDEXES:
+                    conn.execute(statement)
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            # e.g. a read-only file or a database without the insurance tables
+            logger.warning(f"Could not prepare database {self.db_path} for queries: {e}")
+            return False
+
+        logger.info(f"Database prepared for queries: {self.db_path}")
+        return True
+
     def close(self) -> None:
         """Close the database connection."""
         if self._connection:
@@ -119,3 +156,45 @@ def connect_db(db_path: str = "insurance_support.db") -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     return conn
+
+
+# Per-thread connections for the read-only tool queries
+_thread_local = threading.local()
+
+# Applied once to each pooled connection: a larger page cache (negative =
+# KiB, 64 MB) stays warm because the connection is reused
+_POOLED_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+def get_pooled_connection(db_path: str = "insurance_support.db") -> sqlite3.Connection:
+    """
+    Get a long-lived connection owned by the calling thread.
+
+    SQLite connections may not be shared across threads, so each worker
+    thread keeps its own. Reusing the connection keeps its page cache warm
+    and reuses sqlite3's per-connection statement cache, so constant SQL
+    strings are parsed and planned once per thread rather than once per
+    call.
+
+    Callers must not close the returned connection.
+
+    Args:
+        db_path: Path to database file
+
+    Returns:
+        SQLite connection with ``sqlite3.Row`` row factory
+    """
+    connections = getattr(_thread_local, "connections", None)
+    if connections is None:
+        connections = _thread_local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = connect_db(db_path)
+        for pragma in _POOLED_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        connections[db_path] = conn
+    return conn
@@ -16,6 +16,8 @@ from src.observability.logging_config import setup_logging, get_logger
 from src.observability.tracing import initialize_tracing
 from src.observability import metrics
 from src.api.models import ErrorResponse
+from src.tools.user_interaction import bind_event_loop
+from src.database.connection import get_db_manager
 
 # Import routers
 from src.api.routes import health, chat, sessions
@@ -84,6 +86,9 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("⚠️  Phoenix tracing disabled")
 
+    # WAL and tool query indexes (schema changes stay out of the tool calls)
+    get_db_manager().prepare_for_queries()
+
     # Initialize workflow
     try:
         from src.graph.workflow import get_workflow
@@ -92,6 +97,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to initialize workflow: {e}", exc_info=True)
 
+    # Let workflow threads route clarification questions through this loop
+    bind_event_loop(asyncio.get_running_loop())
+
     # Start session cleanup background task
     cleanup_task = asyncio.create_task(session_cleanup_task())
     logger.info("✅ Session cleanup task started")
@@ -103,6 +111,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info(f"👋 Shutting down {settings.APP_NAME}")
 
+    bind_event_loop(None)
+
     # Cancel cleanup task
     if cleanup_task:
         cleanup_task.cancel()
@@ -113,6 +123,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping cleanup task: {e}")
 
+    # Send any buffered session writes before exiting
+    if settings.SESSION_WRITE_BEHIND_ENABLED:
+        from src.session.manager import get_session_manager
+        if not get_session_manager().flush_writes(timeout=5.0):
+            logger.warning("⚠️  Some buffered session writes were not flushed")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -207,23 +223,8 @@ async def add_request_id(request: Request, call_next):
         )
 
 
-# Metrics Tracking Middleware
-@app.middleware("http")
-async def track_in_progress_requests(request: Request, call_next):
-    """Track in-progress API requests."""
-    metrics.api_requests_in_progress.labels(
-        method=request.method,
-        endpoint=request.url.path,
-    ).inc()
-
-    try:
-        response = await call_next(request)
-        return response
-    finally:
-        metrics.api_requests_in_progress.labels(
-            method=request.method,
-            endpoint=request.url.path,
-        ).dec()
+# Metrics Tracking Middleware (pure ASGI, tracks in-progress requests)
+app.add_middleware(metrics.MetricsMiddleware)
 
 
 # ============================================================================
@@ -13,6 +13,9 @@ from src.config import settings
 class JSONFormatter(logging.Formatter):
     """Custom formatter that outputs logs in JSON format."""
 
+    # Optional fields passed via ``extra=`` that are copied into the output
+    EXTRA_FIELDS = ("request_id", "session_id", "agent_name", "duration_ms")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
         log_data: Dict[str, Any] = {
@@ -29,15 +32,12 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields from record
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "session_id"):
-            log_data["session_id"] = record.session_id
-        if hasattr(record, "agent_name"):
-            log_data["agent_name"] = record.agent_name
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        # Add extra fields from record (plain dict lookups, no AttributeError)
+        record_dict = record.__dict__
+        for field in self.EXTRA_FIELDS:
+            value = record_dict.get(field)
+            if value is not None:
+                log_data[field] = value
 
         return json.dumps(log_data)
 
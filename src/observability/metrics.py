@@ -2,7 +2,9 @@
 Prometheus metrics for monitoring application performance.
 """
 from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
+import threading
+from starlette.routing import Match
 from src.config import settings
 
 # Application info
@@ -63,9 +65,11 @@ llm_requests_total = Counter(
 llm_tokens_used_total = Counter(
     "llm_tokens_used_total",
     "Total number of tokens used",
-    ["model", "token_type"],  # token_type: prompt, completion, total
+    ["model", "token_type"],  # token_type: prompt, completion (sum them for the total)
 )
 
+# prometheus_client has no native (sparse exponential) histograms; observe()
+# increments only the first matching bucket, so the bucket count stays cheap.
 llm_request_duration_seconds = Histogram(
     "llm_request_duration_seconds",
     "LLM request duration in seconds",
@@ -73,30 +77,6 @@ llm_request_duration_seconds = Histogram(
     buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0),
 )
 
-# Database Metrics
-db_queries_total = Counter(
-    "db_queries_total",
-    "Total number of database queries",
-    ["operation", "table", "status"],
-)
-
-db_query_duration_seconds = Histogram(
-    "db_query_duration_seconds",
-    "Database query duration in seconds",
-    ["operation", "table"],
-    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
-)
-
-db_connections_active = Gauge(
-    "db_connections_active",
-    "Number of active database connections",
-)
-
-db_connections_pool_size = Gauge(
-    "db_connections_pool_size",
-    "Database connection pool size",
-)
-
 # Session Metrics
 active_sessions_total = Gauge(
     "active_sessions_total",
@@ -109,26 +89,6 @@ session_operations_total = Counter(
     ["operation", "status"],  # operation: create, get, update, delete
 )
 
-session_duration_seconds = Histogram(
-    "session_duration_seconds",
-    "Session lifetime duration in seconds",
-    buckets=(60, 300, 600, 1800, 3600, 7200),  # 1m to 2h
-)
-
-# Vector Store Metrics
-vector_store_queries_total = Counter(
-    "vector_store_queries_total",
-    "Total number of vector store queries",
-    ["collection", "status"],
-)
-
-vector_store_query_duration_seconds = Histogram(
-    "vector_store_query_duration_seconds",
-    "Vector store query duration in seconds",
-    ["collection"],
-    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
-)
-
 # Conversation Metrics
 conversations_total = Counter(
     "conversations_total",
@@ -154,6 +114,111 @@ supervisor_iterations_total = Histogram(
 )
 
 
+# ============================================================================
+# Lazily-registered metrics
+# ============================================================================
+# Metrics that only specific subsystems touch (database tools, vector store)
+# are registered with the global registry on first attribute access instead
+# of at import time. Access them as usual: ``metrics.db_queries_total``.
+
+_LAZY_METRICS: Dict[str, Callable[[], Any]] = {
+    # Database Metrics
+    "db_queries_total": lambda: Counter(
+        "db_queries_total",
+        "Total number of database queries",
+        ["operation", "table", "status"],
+    ),
+    "db_query_duration_seconds": lambda: Histogram(
+        "db_query_duration_seconds",
+        "Database query duration in seconds",
+        ["operation", "table"],
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    ),
+    "db_cache_hits_total": lambda: Counter(
+        "db_cache_hits_total",
+        "Tool lookups served from the in-process cache",
+        ["table"],
+    ),
+    "db_cache_misses_total": lambda: Counter(
+        "db_cache_misses_total",
+        "Tool lookups that missed the in-process cache",
+        ["table"],
+    ),
+    "db_connections_active": lambda: Gauge(
+        "db_connections_active",
+        "Number of active database connections",
+    ),
+    "db_connections_pool_size": lambda: Gauge(
+        "db_connections_pool_size",
+        "Database connection pool size",
+    ),
+    # LLM Response Cache Metrics
+    "llm_cache_hits_total": lambda: Counter(
+        "llm_cache_hits_total",
+        "Deterministic LLM requests served from the response cache",
+        ["model"],
+    ),
+    "llm_cache_misses_total": lambda: Counter(
+        "llm_cache_misses_total",
+        "Deterministic LLM requests that missed the response cache",
+        ["model"],
+    ),
+    # Session Metrics
+    "session_duration_seconds": lambda: Histogram(
+        "session_duration_seconds",
+        "Session lifetime duration in seconds",
+        buckets=(60, 300, 600, 1800, 3600, 7200),  # 1m to 2h
+    ),
+    "session_l1_hits_total": lambda: Counter(
+        "session_l1_hits_total",
+        "Session reads served from the in-process L1 cache",
+    ),
+    "session_l1_misses_total": lambda: Counter(
+        "session_l1_misses_total",
+        "Session reads that missed the in-process L1 cache",
+    ),
+    # Vector Store Metrics
+    "vector_store_queries_total": lambda: Counter(
+        "vector_store_queries_total",
+        "Total number of vector store queries",
+        ["collection", "status"],
+    ),
+    "vector_store_query_duration_seconds": lambda: Histogram(
+        "vector_store_query_duration_seconds",
+        "Vector store query duration in seconds",
+        ["collection"],
+        buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
+    ),
+}
+
+_lazy_metrics_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create and register a lazy metric on first access.
+
+    The metric is cached in the module namespace, so later lookups never
+    reach this function.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The registered metric
+    """
+    factory = _LAZY_METRICS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _lazy_metrics_lock:
+        metric = globals().get(name)
+        if metric is None:
+            metric = factory()
+            globals()[name] = metric
+    return metric
+
+
 def get_metrics() -> bytes:
     """
     Generate Prometheus metrics in text format.
@@ -164,25 +229,58 @@ def get_metrics() -> bytes:
     return generate_latest()
 
 
+def _route_template(scope) -> str:
+    """
+    Get the path template of the route a request will be served by.
+
+    Labelling by template (``/api/v1/sessions/{session_id}``) instead of
+    the raw path keeps the number of label sets bounded.
+
+    Args:
+        scope: ASGI scope of the request
+
+    Returns:
+        The route's path template, or "unmatched"
+    """
+    router = getattr(scope.get("app"), "router", None)
+    partial = None
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            # Path matches but the method does not (405)
+            partial = route.path
+    return partial or "unmatched"
+
+
 class MetricsMiddleware:
     """
-    Middleware to automatically track request metrics.
-    To be used with FastAPI.
+    Pure ASGI middleware that tracks in-progress API requests.
+    To be used with FastAPI via ``app.add_middleware(MetricsMiddleware)``.
+
+    Labeled gauge children are resolved once per (method, route template)
+    and cached, so steady-state requests skip the ``labels()`` lookup.
     """
 
     def __init__(self, app):
         self.app = app
+        self._in_progress: Dict[tuple, Any] = {}
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            method = scope["method"]
-            path = scope["path"]
-
-            # Track in-progress requests
-            api_requests_in_progress.labels(method=method, endpoint=path).inc()
-
-            try:
-                await self.app(scope, receive, send)
-            finally:
-                # Decrement in-progress counter
-                api_requests_in_progress.labels(method=method, endpoint=path).dec()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["method"], _route_template(scope))
+        gauge = self._in_progress.get(key)
+        if gauge is None:
+            gauge = api_requests_in_progress.labels(method=key[0], endpoint=key[1])
+            self._in_progress[key] = gauge
+
+        # Track in-progress requests
+        gauge.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gauge.dec()
@@ -3,6 +3,7 @@ OpenTelemetry tracing with Phoenix integration.
 Provides decorators and utilities for tracing agent execution.
 """
 from functools import wraps
+import json
 import time
 from typing import Any, Callable, Dict, Optional
 from opentelemetry.trace import get_current_span, Status, StatusCode, Tracer
@@ -118,14 +119,14 @@ def trace_agent(func: Callable) -> Callable:
 
             span.set_attribute("timestamp", time.time())
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 # Execute the agent function
                 result = func(*args, **kwargs)
 
                 # Record execution metadata
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 span.set_attribute("execution.duration_sec", duration)
 
                 # Add result metadata if result is a dict
@@ -156,6 +157,9 @@ def trace_function(
     """
     Generic decorator to trace any function with custom attributes.
 
+    With TOOLS_TRACE enabled, each call also logs its duration as a JSON
+    line such as {"fn": "get_policy_details", "ms": 0.42}.
+
     Usage:
         @trace_function(name="database_query", attributes={"db.operation": "select"})
         def query_database(query):
@@ -171,8 +175,7 @@ def trace_function(
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        def traced(*args, **kwargs) -> Any:
             tracer = get_tracer()
 
             # If tracing is not enabled, just execute the function
@@ -190,12 +193,12 @@ def trace_function(
                 span.set_attribute("function.name", func.__name__)
                 span.set_attribute("function.module", func.__module__)
 
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 try:
                     result = func(*args, **kwargs)
 
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     span.set_attribute("execution.duration_sec", duration)
                     span.set_status(Status(StatusCode.OK))
 
@@ -206,6 +209,19 @@ def trace_function(
                     span.set_status(Status(StatusCode.ERROR, str(e)))
                     raise
 
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if not settings.TOOLS_TRACE:
+                return traced(*args, **kwargs)
+
+            # One JSON line per call, independent of Phoenix
+            start_time = time.perf_counter()
+            try:
+                return traced(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                logger.info(json.dumps({"fn": name or func.__name__, "ms": round(elapsed_ms, 3)}))
+
         return wrapper
 
     return decorator
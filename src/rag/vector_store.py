@@ -2,16 +2,17 @@
 Vector store management using ChromaDB for FAQ retrieval.
 """
 import time
-from typing import List, Dict, Any, Optional
-import chromadb
-from chromadb.api import ClientAPI
-from chromadb.api.models.Collection import Collection
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
 from src.config import settings
 from src.observability.logging_config import get_logger
 from src.observability.tracing import trace_function
 from src.observability import metrics
 
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+    from chromadb.api.models.Collection import Collection
+
 logger = get_logger(__name__)
 
 
@@ -34,8 +35,8 @@ class VectorStoreManager:
         """
         self.persist_dir = persist_dir or settings.CHROMA_PERSIST_DIR
         self.collection_name = collection_name or settings.CHROMA_COLLECTION_NAME
-        self._client: Optional[ClientAPI] = None
-        self._collection: Optional[Collection] = None
+        self._client: Optional["ClientAPI"] = None
+        self._collection: Optional["Collection"] = None
 
         logger.info(
             f"Vector store manager initialized: dir={self.persist_dir}, "
@@ -43,7 +44,7 @@ class VectorStoreManager:
         )
 
     @property
-    def client(self) -> ClientAPI:
+    def client(self) -> "ClientAPI":
         """
         Get or create ChromaDB client.
 
@@ -51,6 +52,10 @@ class VectorStoreManager:
             ChromaDB client instance
         """
         if self._client is None:
+            # Imported here: chromadb takes a few hundred ms to import and is
+            # only needed once a query is made
+            import chromadb
+
             try:
                 self._client = chromadb.PersistentClient(path=self.persist_dir)
                 logger.info(f"ChromaDB client connected: {self.persist_dir}")
@@ -60,7 +65,7 @@ class VectorStoreManager:
         return self._client
 
     @property
-    def collection(self) -> Collection:
+    def collection(self) -> "Collection":
         """
         Get or create the FAQ collection.
 
@@ -106,7 +111,7 @@ class VectorStoreManager:
         n_results = n_results or settings.FAQ_RETRIEVAL_TOP_K
 
         logger.info(f"🔍 Querying vector store: '{query_text}' (top {n_results})")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Build include list
@@ -125,7 +130,7 @@ class VectorStoreManager:
                 include=include,
             )
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             metrics.vector_store_query_duration_seconds.labels(
                 collection=self.collection_name
             ).observe(duration)
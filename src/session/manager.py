@@ -2,21 +2,215 @@
 Redis-based session manager for stateful conversations.
 Handles session storage, retrieval, and lifecycle management.
 """
-import json
+import queue
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from datetime import datetime, timedelta
+import msgspec
+from cachetools import TTLCache
 from redis import Redis
+from redis.client import Pipeline
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
-from src.session.models import SessionState, MessageRole
+from src.session.models import (
+    ConversationMessageMsg,
+    SessionContextMsg,
+    SessionState,
+    SessionStateMsg,
+)
 from src.config import settings
+from src.utils.redis_pool import get_connection_pool
 from src.observability.logging_config import get_logger
 from src.observability.tracing import trace_function
 from src.observability import metrics
 
 logger = get_logger(__name__)
 
+# Labeled session operation counters, resolved once instead of per call
+_M_CREATE_OK = metrics.session_operations_total.labels(operation="create", status="success")
+_M_GET_OK = metrics.session_operations_total.labels(operation="get", status="success")
+_M_GET_MISS = metrics.session_operations_total.labels(operation="get", status="not_found")
+_M_GET_ERR = metrics.session_operations_total.labels(operation="get", status="error")
+_M_UPDATE_OK = metrics.session_operations_total.labels(operation="update", status="success")
+_M_UPDATE_ERR = metrics.session_operations_total.labels(operation="update", status="error")
+_M_DELETE_OK = metrics.session_operations_total.labels(operation="delete", status="success")
+_M_DELETE_MISS = metrics.session_operations_total.labels(operation="delete", status="not_found")
+_M_DELETE_ERR = metrics.session_operations_total.labels(operation="delete", status="error")
+
+# Sessions are stored in Redis as MessagePack (binary, smaller than JSON)
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder()
+
+# Typed decoders for the read-only msgspec form; msgspec validates against
+# the mirrors of the session models while decoding
+_META_DECODER = msgspec.msgpack.Decoder(SessionStateMsg)
+_CONTEXT_DECODER = msgspec.msgpack.Decoder(SessionContextMsg)
+_GRAPH_STATE_DECODER = msgspec.msgpack.Decoder(Dict[str, Any])
+_MESSAGE_DECODER = msgspec.msgpack.Decoder(ConversationMessageMsg)
+
+# Each session is a hash of separately encoded fields plus a list holding one
+# encoded entry per message, so an update only sends what changed instead of
+# rewriting the whole message history
+_StoredSession = Tuple[Dict[bytes, bytes], List[bytes]]
+
+
+def _encode_session(session: SessionState) -> Tuple[Dict[str, bytes], List[Dict[str, Any]]]:
+    """
+    Split a session into encoded hash fields and serialized messages.
+
+    Args:
+        session: SessionState to encode
+
+    Returns:
+        Tuple of (hash fields, message dicts)
+    """
+    data = session.to_dict()
+    messages = data.pop("messages")
+    fields = {
+        "context": _ENCODER.encode(data.pop("context")),
+        "graph_state": _ENCODER.encode(data.pop("graph_state")),
+        "meta": _ENCODER.encode(data),
+    }
+    return fields, messages
+
+
+def _decode_session(stored: _StoredSession) -> SessionState:
+    """
+    Rebuild a session from its hash fields and message list.
+
+    Args:
+        stored: Tuple of (HGETALL result, LRANGE result)
+
+    Returns:
+        SessionState remembering what is already persisted
+    """
+    fields, messages = stored
+    data = _DECODER.decode(fields[b"meta"])
+    data["context"] = _DECODER.decode(fields[b"context"])
+    data["graph_state"] = _DECODER.decode(fields[b"graph_state"])
+    data["messages"] = [_DECODER.decode(message) for message in messages]
+
+    session = SessionState.from_dict(data)
+    session._stored_fields = {name.decode(): value for name, value in fields.items()}
+    session._stored_message_count = len(messages)
+    return session
+
+
+def _decode_session_msg(stored: _StoredSession) -> SessionStateMsg:
+    """
+    Decode a session's hash fields and message list into its msgspec form.
+
+    Args:
+        stored: Tuple of (HGETALL result, LRANGE result)
+
+    Returns:
+        SessionStateMsg
+    """
+    fields, messages = stored
+    msg = _META_DECODER.decode(fields[b"meta"])
+    msg.context = _CONTEXT_DECODER.decode(fields[b"context"])
+    msg.graph_state = _GRAPH_STATE_DECODER.decode(fields[b"graph_state"])
+    msg.messages = [_MESSAGE_DECODER.decode(message) for message in messages]
+    return msg
+
+
+def _forget_stored_state(session: SessionState) -> None:
+    """
+    Mark nothing of a session as persisted after a failed write.
+
+    The next write then sends every hash field and rewrites the message
+    list instead of a delta against what never reached Redis.
+    """
+    session._stored_fields = {}
+    session._stored_message_count = None
+
+
+class _WriteBuffer:
+    """
+    Background writer that batches session writes into pipelines.
+
+    Writes are queued and return immediately; a daemon thread drains up to
+    ``max_batch`` queued writes at a time and sends them in one pipeline.
+    ``flush(key)`` blocks until a key has no pending writes, which callers
+    use to keep read-your-writes semantics.
+    """
+
+    def __init__(self, redis: Redis, max_batch: int = 100):
+        self._redis = redis
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, Callable[[Pipeline], None], Optional[Callable[[], None]]]]" = queue.Queue()
+        self._pending: Dict[str, int] = {}
+        self._pending_changed = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name="session-write-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def put(
+        self,
+        key: str,
+        write: Callable[[Pipeline], None],
+        on_error: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue a write (a function adding commands to a pipeline) for a key.
+
+        ``on_error`` is called from the writer thread if the batch holding
+        the write fails to execute.
+        """
+        with self._pending_changed:
+            self._pending[key] = self._pending.get(key, 0) + 1
+        self._queue.put((key, write, on_error))
+
+    def flush(self, key: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for pending writes to reach Redis.
+
+        Args:
+            key: Only wait for writes to this key (defaults to all keys)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if no matching writes are pending anymore
+        """
+        with self._pending_changed:
+            if key is None:
+                return self._pending_changed.wait_for(lambda: not self._pending, timeout)
+            return self._pending_changed.wait_for(lambda: key not in self._pending, timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with self._redis.pipeline(transaction=False) as pipe:
+                    for _, write, _ in batch:
+                        write(pipe)
+                    pipe.execute()
+                _M_UPDATE_OK.inc(len(batch))
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} buffered sessions: {e}", exc_info=True)
+                _M_UPDATE_ERR.inc(len(batch))
+                for _, _, on_error in batch:
+                    if on_error is not None:
+                        on_error()
+            finally:
+                with self._pending_changed:
+                    for key, _, _ in batch:
+                        remaining = self._pending[key] - 1
+                        if remaining:
+                            self._pending[key] = remaining
+                        else:
+                            del self._pending[key]
+                    self._pending_changed.notify_all()
+
 
 class SessionManager:
     """
@@ -49,6 +243,20 @@ class SessionManager:
 
         self._redis: Optional[Redis] = None
         self._redis_available = False
+        self._write_buffer: Optional[_WriteBuffer] = None
+
+        # Optional in-process L1 cache of encoded payloads, keyed like Redis
+        self._l1_cache: Optional[TTLCache] = None
+        self._l1_lock = threading.Lock()
+
+        # Serializes encoding against the stored-state bookkeeping, which the
+        # write-behind thread resets when a buffered write fails
+        self._prepare_lock = threading.Lock()
+        if settings.SESSION_L1_CACHE_TTL_SECONDS > 0:
+            self._l1_cache = TTLCache(
+                maxsize=settings.SESSION_L1_CACHE_SIZE,
+                ttl=settings.SESSION_L1_CACHE_TTL_SECONDS,
+            )
 
         # Try to connect to Redis
         try:
@@ -60,19 +268,17 @@ class SessionManager:
     def _connect(self) -> None:
         """Establish Redis connection."""
         try:
-            self._redis = Redis.from_url(
-                self.redis_url,
-                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
-                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
-                max_connections=settings.REDIS_MAX_CONNECTIONS,
-                decode_responses=True,
-            )
+            self._redis = Redis(connection_pool=get_connection_pool(self.redis_url))
 
             # Test connection
             self._redis.ping()
             self._redis_available = True
             logger.info(f"✅ Connected to Redis: {self.redis_url}")
 
+            if settings.SESSION_WRITE_BEHIND_ENABLED:
+                self._write_buffer = _WriteBuffer(self._redis)
+                logger.info("✅ Session write-behind buffer enabled")
+
         except (RedisError, RedisConnectionError) as e:
             logger.warning(f"⚠️  Redis connection failed: {e}")
             self._redis_available = False
@@ -82,6 +288,35 @@ class SessionManager:
         """Get Redis key for session."""
         return f"{self.key_prefix}{session_id}"
 
+    def _get_messages_key(self, key: str) -> str:
+        """Get Redis key for a session's message list."""
+        return f"{key}:messages"
+
+    def _cache_get(self, key: str) -> Optional[_StoredSession]:
+        """Look up an encoded session in the L1 cache."""
+        if self._l1_cache is None:
+            return None
+
+        with self._l1_lock:
+            data = self._l1_cache.get(key)
+
+        if data is None:
+            metrics.session_l1_misses_total.inc()
+        else:
+            metrics.session_l1_hits_total.inc()
+        return data
+
+    def _cache_set(self, key: str, data: Optional[_StoredSession]) -> None:
+        """Store an encoded session in the L1 cache (None evicts)."""
+        if self._l1_cache is None:
+            return
+
+        with self._l1_lock:
+            if data is None:
+                self._l1_cache.pop(key, None)
+            else:
+                self._l1_cache[key] = data
+
     @trace_function(name="session_create", attributes={"operation": "create"})
     def create_session(self, session_id: str) -> SessionState:
         """
@@ -95,25 +330,36 @@ class SessionManager:
         """
         logger.info(f"Creating new session: {session_id}")
 
-        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
-
-        session = SessionState(
-            session_id=session_id,
-            created_at=datetime.utcnow(),
-            last_activity=datetime.utcnow(),
-            expires_at=expires_at,
-        )
+        session = self._new_session(session_id)
 
         # Store session
         self._set_session(session)
 
-        metrics.session_operations_total.labels(operation="create", status="success").inc()
+        _M_CREATE_OK.inc()
         metrics.active_sessions_total.inc()
 
         logger.info(f"✅ Session created: {session_id}")
 
         return session
 
+    def _new_session(self, session_id: str) -> SessionState:
+        """
+        Build an unsaved SessionState stamped with a single clock read.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            New SessionState
+        """
+        now = datetime.utcnow()
+        return SessionState(
+            session_id=session_id,
+            created_at=now,
+            last_activity=now,
+            expires_at=now + timedelta(seconds=self.ttl_seconds),
+        )
+
     @trace_function(name="session_get", attributes={"operation": "get"})
     def get_session(self, session_id: str) -> Optional[SessionState]:
         """
@@ -125,21 +371,91 @@ class SessionManager:
         Returns:
             SessionState if found, None otherwise
         """
+        return self._get_one(session_id, _decode_session, lambda session: session)
+
+    @trace_function(name="session_get_msg", attributes={"operation": "get"})
+    def get_session_msg(self, session_id: str) -> Optional[SessionStateMsg]:
+        """
+        Retrieve a session for reading only, without building pydantic models.
+
+        Changes to the returned struct are not saved.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            SessionStateMsg if found, None otherwise
+        """
+        return self._get_one(session_id, _decode_session_msg, SessionState.to_msg)
+
+    @trace_function(name="session_get_many", attributes={"operation": "get"})
+    def get_sessions(self, session_ids: List[str]) -> List[SessionState]:
+        """
+        Retrieve several sessions in a single round-trip.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            Sessions that were found, in the order requested
+        """
+        return self._get_many(session_ids, _decode_session, lambda session: session)
+
+    @trace_function(name="session_get_many_msg", attributes={"operation": "get"})
+    def get_sessions_msg(self, session_ids: List[str]) -> List[SessionStateMsg]:
+        """
+        Retrieve several sessions for reading only in a single round-trip.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            Sessions that were found, in the order requested
+        """
+        return self._get_many(session_ids, _decode_session_msg, SessionState.to_msg)
+
+    def _get_one(
+        self,
+        session_id: str,
+        decode: Callable[[_StoredSession], Any],
+        from_memory: Callable[[SessionState], Any],
+    ) -> Any:
+        """
+        Retrieve a session from Redis or memory.
+
+        Args:
+            session_id: Session identifier
+            decode: Builds the result from the stored hash and message list
+            from_memory: Builds the result from an in-memory SessionState
+
+        Returns:
+            Decoded session if found, None otherwise
+        """
         logger.debug(f"Retrieving session: {session_id}")
 
         try:
             if self._redis_available and self._redis:
                 # Get from Redis
                 key = self._get_key(session_id)
-                data = self._redis.get(key)
+                data = self._cache_get(key)
+                if data is None:
+                    if self._write_buffer:
+                        self._write_buffer.flush(key)
+                    with self._redis.pipeline() as pipe:
+                        pipe.hgetall(key)
+                        pipe.lrange(self._get_messages_key(key), 0, -1)
+                        fields, messages = pipe.execute()
+                    if fields:
+                        data = (fields, messages)
+                        self._cache_set(key, data)
 
                 if data:
-                    session = SessionState.from_dict(json.loads(data))
-                    metrics.session_operations_total.labels(operation="get", status="success").inc()
+                    session = decode(data)
+                    _M_GET_OK.inc()
                     logger.debug(f"✅ Session found in Redis: {session_id}")
                     return session
                 else:
-                    metrics.session_operations_total.labels(operation="get", status="not_found").inc()
+                    _M_GET_MISS.inc()
                     logger.debug(f"❌ Session not found in Redis: {session_id}")
                     return None
 
@@ -147,18 +463,123 @@ class SessionManager:
                 # Get from in-memory store
                 session = self._in_memory_store.get(session_id)
                 if session:
-                    metrics.session_operations_total.labels(operation="get", status="success").inc()
+                    _M_GET_OK.inc()
                     logger.debug(f"✅ Session found in memory: {session_id}")
+                    return from_memory(session)
                 else:
-                    metrics.session_operations_total.labels(operation="get", status="not_found").inc()
+                    _M_GET_MISS.inc()
                     logger.debug(f"❌ Session not found in memory: {session_id}")
-                return session
+                    return None
 
         except Exception as e:
             logger.error(f"Error retrieving session {session_id}: {e}", exc_info=True)
-            metrics.session_operations_total.labels(operation="get", status="error").inc()
+            _M_GET_ERR.inc()
             return None
 
+    def _get_many(
+        self,
+        session_ids: List[str],
+        decode: Callable[[_StoredSession], Any],
+        from_memory: Callable[[SessionState], Any],
+    ) -> List[Any]:
+        """
+        Retrieve several sessions from Redis (one pipeline) or memory.
+
+        Args:
+            session_ids: Session identifiers
+            decode: Builds a result from a stored hash and message list
+            from_memory: Builds a result from an in-memory SessionState
+
+        Returns:
+            Decoded sessions that were found, in the order requested
+        """
+        logger.debug(f"Retrieving {len(session_ids)} sessions")
+
+        if not session_ids:
+            return []
+
+        try:
+            if self._redis_available and self._redis:
+                if self._write_buffer:
+                    self._write_buffer.flush()
+
+                # Pipeline the reads so N sessions cost one RTT
+                with self._redis.pipeline() as pipe:
+                    for session_id in session_ids:
+                        key = self._get_key(session_id)
+                        pipe.hgetall(key)
+                        pipe.lrange(self._get_messages_key(key), 0, -1)
+                    results = pipe.execute()
+
+                sessions = [
+                    decode((fields, messages))
+                    for fields, messages in zip(results[::2], results[1::2])
+                    if fields
+                ]
+            else:
+                sessions = [
+                    from_memory(self._in_memory_store[session_id])
+                    for session_id in session_ids
+                    if session_id in self._in_memory_store
+                ]
+
+            _M_GET_OK.inc(len(sessions))
+            missing = len(session_ids) - len(sessions)
+            if missing:
+                _M_GET_MISS.inc(missing)
+
+            return sessions
+
+        except Exception as e:
+            logger.error(f"Error retrieving sessions: {e}", exc_info=True)
+            _M_GET_ERR.inc()
+            return []
+
+    def _prepare_write(self, session: SessionState) -> Tuple[str, Callable[[Pipeline], None]]:
+        """
+        Build the Redis commands that persist what changed in a session.
+
+        Hash fields whose encoding differs from the stored one are HSET and
+        messages added since the last write are RPUSHed; if the stored
+        message list is unknown or longer than the session's, it is
+        rewritten. Both keys get their TTL reset. The session is then
+        considered stored.
+
+        Args:
+            session: SessionState to persist
+
+        Returns:
+            Tuple of (session key, function adding the commands to a pipeline)
+        """
+        key = self._get_key(session.session_id)
+        messages_key = self._get_messages_key(key)
+        ttl_seconds = self.ttl_seconds
+
+        fields, messages = _encode_session(session)
+        changed = {
+            name: value for name, value in fields.items()
+            if session._stored_fields.get(name) != value
+        }
+
+        stored_count = session._stored_message_count
+        rewrite_messages = stored_count is None or stored_count > len(messages)
+        new_messages = messages if rewrite_messages else messages[stored_count:]
+        encoded_messages = [_ENCODER.encode(message) for message in new_messages]
+
+        def write(pipe: Pipeline) -> None:
+            if changed:
+                pipe.hset(key, mapping=changed)
+            if rewrite_messages:
+                pipe.delete(messages_key)
+            if encoded_messages:
+                pipe.rpush(messages_key, *encoded_messages)
+            pipe.expire(key, ttl_seconds)
+            pipe.expire(messages_key, ttl_seconds)
+
+        session._stored_fields = fields
+        session._stored_message_count = len(messages)
+        return key, write
+
     def _set_session(self, session: SessionState) -> None:
         """
         Store session in Redis or memory.
@@ -169,15 +590,18 @@ class SessionManager:
         try:
             if self._redis_available and self._redis:
                 # Store in Redis with TTL
-                key = self._get_key(session.session_id)
-                data = json.dumps(session.to_dict())
-                self._redis.setex(key, self.ttl_seconds, data)
+                key, write = self._prepare_write(session)
+                with self._redis.pipeline() as pipe:
+                    write(pipe)
+                    pipe.execute()
+                self._cache_set(key, None)
             else:
                 # Store in memory
                 self._in_memory_store[session.session_id] = session
 
         except Exception as e:
             logger.error(f"Error storing session {session.session_id}: {e}", exc_info=True)
+            _forget_stored_state(session)
             # Fallback to memory
             self._in_memory_store[session.session_id] = session
 
@@ -192,9 +616,58 @@ class SessionManager:
         logger.debug(f"Updating session: {session.session_id}")
 
         session.last_activity = datetime.utcnow()
-        self._set_session(session)
 
-        metrics.session_operations_total.labels(operation="update", status="success").inc()
+        if self._write_buffer:
+            # Counted by the background writer once the write has been sent
+            key = self._buffer_write(session)
+            self._cache_set(key, None)
+        else:
+            self._set_session(session)
+            _M_UPDATE_OK.inc()
+
+    def _buffer_write(self, session: SessionState, repair: bool = True) -> str:
+        """
+        Encode a session now and queue the write for the background writer.
+
+        Writes queued after this one are deltas that assume it succeeds. If
+        it fails, the session is marked as not stored and, unless this write
+        is itself a repair, a full rewrite is queued behind those deltas so
+        nothing they left out stays missing.
+
+        Args:
+            session: SessionState to persist
+            repair: Queue a full rewrite if this write fails
+
+        Returns:
+            Session key
+        """
+        with self._prepare_lock:
+            key, write = self._prepare_write(session)
+
+        def on_error() -> None:
+            with self._prepare_lock:
+                _forget_stored_state(session)
+            if repair:
+                self._buffer_write(session, repair=False)
+
+        self._write_buffer.put(key, write, on_error=on_error)
+        return key
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until buffered session writes have been sent to Redis.
+
+        No-op unless SESSION_WRITE_BEHIND_ENABLED is set.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all buffered writes were sent
+        """
+        if self._write_buffer is None:
+            return True
+        return self._write_buffer.flush(timeout=timeout)
 
     @trace_function(name="session_delete", attributes={"operation": "delete"})
     def delete_session(self, session_id: str) -> bool:
@@ -212,32 +685,36 @@ class SessionManager:
         try:
             if self._redis_available and self._redis:
                 key = self._get_key(session_id)
-                deleted = self._redis.delete(key)
+                if self._write_buffer:
+                    # A buffered write landing after DEL would resurrect the session
+                    self._write_buffer.flush(key)
+                self._cache_set(key, None)
+                deleted = self._redis.delete(key, self._get_messages_key(key))
 
                 if deleted:
-                    metrics.session_operations_total.labels(operation="delete", status="success").inc()
+                    _M_DELETE_OK.inc()
                     metrics.active_sessions_total.dec()
                     logger.info(f"✅ Session deleted from Redis: {session_id}")
                     return True
                 else:
-                    metrics.session_operations_total.labels(operation="delete", status="not_found").inc()
+                    _M_DELETE_MISS.inc()
                     return False
 
             else:
                 # Delete from memory
                 if session_id in self._in_memory_store:
                     del self._in_memory_store[session_id]
-                    metrics.session_operations_total.labels(operation="delete", status="success").inc()
+                    _M_DELETE_OK.inc()
                     metrics.active_sessions_total.dec()
                     logger.info(f"✅ Session deleted from memory: {session_id}")
                     return True
                 else:
-                    metrics.session_operations_total.labels(operation="delete", status="not_found").inc()
+                    _M_DELETE_MISS.inc()
                     return False
 
         except Exception as e:
             logger.error(f"Error deleting session {session_id}: {e}", exc_info=True)
-            metrics.session_operations_total.labels(operation="delete", status="error").inc()
+            _M_DELETE_ERR.inc()
             return False
 
     def list_sessions(self, limit: int = 100) -> List[str]:
@@ -254,10 +731,19 @@ class SessionManager:
 
         try:
             if self._redis_available and self._redis:
-                # List from Redis
+                # Sessions still in the write buffer don't exist in Redis yet
+                if self._write_buffer:
+                    self._write_buffer.flush()
+
+                # List from Redis using non-blocking SCAN instead of KEYS;
+                # only session hashes, not their message lists
                 pattern = f"{self.key_prefix}*"
-                keys = self._redis.keys(pattern)
-                session_ids = [key.replace(self.key_prefix, "") for key in keys[:limit]]
+                prefix_len = len(self.key_prefix)
+                session_ids = []
+                for key in self._redis.scan_iter(match=pattern, count=500, _type="hash"):
+                    session_ids.append(key.decode()[prefix_len:])
+                    if len(session_ids) >= limit:
+                        break
                 logger.debug(f"Found {len(session_ids)} sessions in Redis")
                 return session_ids
 
@@ -298,16 +784,33 @@ class SessionManager:
         Returns:
             True if refreshed, False if not found
         """
-        session = self.get_session(session_id)
+        try:
+            if self._redis_available and self._redis:
+                # Redis TTL is the source of truth: EXPIRE, no payload round-trip
+                key = self._get_key(session_id)
+                if self._write_buffer:
+                    # EXPIRE must not overtake a queued first write
+                    self._write_buffer.flush(key)
+                with self._redis.pipeline() as pipe:
+                    pipe.expire(key, self.ttl_seconds)
+                    pipe.expire(self._get_messages_key(key), self.ttl_seconds)
+                    refreshed = bool(pipe.execute()[0])
+            else:
+                session = self._in_memory_store.get(session_id)
+                refreshed = session is not None
+                if refreshed:
+                    session.expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+                    self.update_session(session)
 
-        if session:
-            session.expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
-            self.update_session(session)
+        except Exception as e:
+            logger.error(f"Error refreshing session TTL {session_id}: {e}", exc_info=True)
+            return False
+
+        if refreshed:
             logger.debug(f"✅ Session TTL refreshed: {session_id}")
-            return True
         else:
             logger.warning(f"❌ Cannot refresh TTL, session not found: {session_id}")
-            return False
+        return refreshed
 
     def cleanup_expired(self) -> int:
         """
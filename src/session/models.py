@@ -2,12 +2,38 @@
 Session state models for conversation management.
 Defines how session data is stored and retrieved.
 """
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
 
+# Serialized sessions store timestamps as integer microseconds since the
+# Unix epoch (naive UTC), which decode with integer arithmetic only.
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(value: datetime) -> int:
+    """Convert a UTC datetime to microseconds since the epoch (naive = UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def from_micros(value: int) -> datetime:
+    """Convert microseconds since the epoch to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _dump_message(message: "ConversationMessage") -> Dict[str, Any]:
+    """Dump a message in its serialized form."""
+    data = message.model_dump()
+    data["timestamp"] = to_micros(data["timestamp"])
+    return data
+
+
 class MessageRole(str, Enum):
     """Message role in conversation."""
     USER = "user"
@@ -15,6 +41,15 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
 
 
+# Speaker labels used when rendering conversation history; system messages
+# have always been shown to the agents as the assistant's
+_ROLE_LABELS = {
+    MessageRole.USER: "User",
+    MessageRole.ASSISTANT: "Assistant",
+    MessageRole.SYSTEM: "Assistant",
+}
+
+
 class ConversationMessage(BaseModel):
     """Single message in a conversation."""
 
@@ -80,6 +115,16 @@ class SessionState(BaseModel):
     is_active: bool = Field(default=True, description="Whether session is active")
     conversation_complete: bool = Field(default=False, description="Whether conversation is complete")
 
+    # Serialized form of each message, appended to incrementally by to_dict(),
+    # and the message objects those dumps were made from
+    _message_dumps: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    _dumped_messages: List["ConversationMessage"] = PrivateAttr(default_factory=list)
+
+    # Storage bookkeeping for SessionManager: encoded hash fields and message
+    # count as last persisted (None means unknown, forcing a full rewrite)
+    _stored_fields: Dict[str, bytes] = PrivateAttr(default_factory=dict)
+    _stored_message_count: Optional[int] = PrivateAttr(default=None)
+
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
@@ -94,15 +139,16 @@ class SessionState(BaseModel):
             content: Message content
             metadata: Optional metadata
         """
+        now = datetime.utcnow()
         message = ConversationMessage(
             role=role,
             content=content,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             metadata=metadata or {}
         )
         self.messages.append(message)
         self.metadata.total_messages = len(self.messages)
-        self.last_activity = datetime.utcnow()
+        self.last_activity = now
 
     def update_context(self, **kwargs) -> None:
         """
@@ -123,27 +169,71 @@ class SessionState(BaseModel):
         self.last_activity = datetime.utcnow()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return self.model_dump(mode='json')
+        """
+        Convert to dictionary for serialization.
+
+        Timestamps are emitted as integer microseconds since the epoch;
+        other values are left as Python objects (enums) for the encoder.
+        Messages are dumped incrementally: only messages appended since the
+        previous call, or since the session was loaded, are converted. If
+        any earlier message was replaced or removed, all are dumped again.
+
+        Returns:
+            Session dictionary
+        """
+        dumps = self._message_dumps
+        dumped = self._dumped_messages
+        if len(dumped) > len(self.messages) or any(
+            old is not new for old, new in zip(dumped, self.messages)
+        ):
+            # Messages were replaced or truncated; rebuild from scratch
+            dumps.clear()
+            dumped.clear()
+        added = self.messages[len(dumped):]
+        dumps.extend(_dump_message(message) for message in added)
+        dumped.extend(added)
+
+        data = self.model_dump(exclude={"messages"})
+        for field in ("created_at", "last_activity", "expires_at"):
+            if data[field] is not None:
+                data[field] = to_micros(data[field])
+        data["messages"] = list(dumps)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionState":
-        """Create SessionState from dictionary."""
-        # Convert string timestamps back to datetime
-        if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-        if 'last_activity' in data and isinstance(data['last_activity'], str):
-            data['last_activity'] = datetime.fromisoformat(data['last_activity'].replace('Z', '+00:00'))
-        if 'expires_at' in data and isinstance(data['expires_at'], str):
-            data['expires_at'] = datetime.fromisoformat(data['expires_at'].replace('Z', '+00:00'))
-
-        # Convert message timestamps
-        if 'messages' in data:
-            for msg in data['messages']:
-                if 'timestamp' in msg and isinstance(msg['timestamp'], str):
-                    msg['timestamp'] = datetime.fromisoformat(msg['timestamp'].replace('Z', '+00:00'))
-
-        return cls(**data)
+        """Create SessionState from a dictionary produced by to_dict()."""
+        data = dict(data)
+
+        # Convert integer timestamps back to datetime
+        for field in ("created_at", "last_activity", "expires_at"):
+            if data.get(field) is not None:
+                data[field] = from_micros(data[field])
+
+        messages = data.get("messages")
+        if messages:
+            data["messages"] = [
+                {**msg, "timestamp": from_micros(msg["timestamp"])} for msg in messages
+            ]
+
+        session = cls(**data)
+
+        # The decoded message dicts already are the serialized form; reuse them
+        # so to_dict() only has to dump messages added after loading
+        if messages:
+            session._message_dumps = list(messages)
+            session._dumped_messages = list(session.messages)
+
+        return session
+
+    def to_msg(self) -> "SessionStateMsg":
+        """
+        Convert to the msgspec form used by read-only callers.
+
+        Returns:
+            SessionStateMsg
+        """
+        return msgspec.convert(self.to_dict(), SessionStateMsg)
 
     def get_conversation_history(self) -> str:
         """
@@ -152,11 +242,9 @@ class SessionState(BaseModel):
         Returns:
             Formatted conversation history
         """
-        history = []
-        for msg in self.messages:
-            role = "User" if msg.role == MessageRole.USER else "Assistant"
-            history.append(f"{role}: {msg.content}")
-        return "\n".join(history)
+        return "\n".join(
+            "%s: %s" % (_ROLE_LABELS[msg.role], msg.content) for msg in self.messages
+        )
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -175,3 +263,52 @@ class SessionState(BaseModel):
             "context": self.context.model_dump(exclude_none=True),
             "metadata": self.metadata.model_dump()
         }
+
+
+# msgspec mirrors of the models above. Read-only callers decode sessions into
+# these directly: msgspec checks the schema while decoding, so no pydantic
+# models are built. Field names match; timestamps are integer microseconds.
+
+class ConversationMessageMsg(msgspec.Struct):
+    """Serialized ConversationMessage."""
+
+    role: MessageRole
+    content: str
+    timestamp: int
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class SessionMetadataMsg(msgspec.Struct):
+    """Serialized SessionMetadata."""
+
+    total_messages: int = 0
+    total_iterations: int = 0
+    agents_used: List[str] = []
+    escalated: bool = False
+    escalation_reason: Optional[str] = None
+    total_tokens: int = 0
+
+
+class SessionContextMsg(msgspec.Struct):
+    """Serialized SessionContext."""
+
+    customer_id: Optional[str] = None
+    policy_number: Optional[str] = None
+    claim_id: Optional[str] = None
+    user_intent: Optional[str] = None
+    entities: Dict[str, Any] = {}
+
+
+class SessionStateMsg(msgspec.Struct):
+    """Serialized SessionState."""
+
+    session_id: str
+    created_at: int
+    last_activity: int
+    expires_at: Optional[int] = None
+    messages: List[ConversationMessageMsg] = []
+    context: SessionContextMsg = msgspec.field(default_factory=SessionContextMsg)
+    metadata: SessionMetadataMsg = msgspec.field(default_factory=SessionMetadataMsg)
+    graph_state: Dict[str, Any] = {}
+    is_active: bool = True
+    conversation_complete: bool = False
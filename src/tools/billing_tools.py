@@ -1,15 +1,50 @@
 """
 Billing-related tools for querying billing and payment information.
 """
-import time
+from time import perf_counter_ns
 from typing import Dict, Any, List
-from src.database.connection import connect_db
+from src.database.connection import get_pooled_connection
+from src.tools.validation import is_valid_identifier
 from src.observability.logging_config import get_logger
 from src.observability.tracing import trace_function
 from src.observability import metrics
 
 logger = get_logger(__name__)
 
+# Labeled query metrics, resolved once instead of per call
+_BILLING_OK = metrics.db_queries_total.labels(operation="select", table="billing", status="success")
+_BILLING_MISS = metrics.db_queries_total.labels(operation="select", table="billing", status="not_found")
+_BILLING_ERR = metrics.db_queries_total.labels(operation="select", table="billing", status="error")
+_BILLING_DUR = metrics.db_query_duration_seconds.labels(operation="select", table="billing")
+_PAYMENTS_OK = metrics.db_queries_total.labels(operation="select", table="payments", status="success")
+_PAYMENTS_MISS = metrics.db_queries_total.labels(operation="select", table="payments", status="not_found")
+_PAYMENTS_ERR = metrics.db_queries_total.labels(operation="select", table="payments", status="error")
+_PAYMENTS_DUR = metrics.db_query_duration_seconds.labels(operation="select", table="payments")
+
+SQL_BILLING_BY_POLICY = """
+    SELECT b.*, p.premium_amount, p.billing_frequency
+    FROM billing b
+    JOIN policies p ON b.policy_number = p.policy_number
+    WHERE b.policy_number = ? AND b.status = 'pending'
+    ORDER BY b.due_date DESC LIMIT 1
+"""
+
+SQL_BILLING_BY_CUSTOMER = """
+    SELECT b.*, p.premium_amount, p.billing_frequency
+    FROM billing b
+    JOIN policies p ON b.policy_number = p.policy_number
+    WHERE p.customer_id = ? AND b.status = 'pending'
+    ORDER BY b.due_date DESC LIMIT 1
+"""
+
+SQL_PAYMENTS_BY_POLICY = """
+    SELECT p.payment_date, p.amount, p.status, p.payment_method
+    FROM payments p
+    JOIN billing b ON p.bill_id = b.bill_id
+    WHERE b.policy_number = ?
+    ORDER BY p.payment_date DESC LIMIT 10
+"""
+
 
 @trace_function(name="get_billing_info", attributes={"db.operation": "select", "db.table": "billing"})
 def get_billing_info(policy_number: str = None, customer_id: str = None) -> Dict[str, Any]:
@@ -23,61 +58,42 @@ def get_billing_info(policy_number: str = None, customer_id: str = None) -> Dict
     Returns:
         Dictionary containing billing information or error
     """
-    logger.info(f"🔍 Fetching billing info - Policy: {policy_number}, Customer: {customer_id}")
-    start_time = time.time()
+    # Reject unusable input before touching the database
+    if not policy_number and not customer_id:
+        return {"error": "Either policy_number or customer_id must be provided"}
+    if policy_number and not is_valid_identifier(policy_number):
+        return {"error": f"Invalid policy number: {policy_number}"}
+    if not policy_number and not is_valid_identifier(customer_id):
+        return {"error": f"Invalid customer ID: {customer_id}"}
+
+    logger.info("🔍 Fetching billing info - Policy: %s, Customer: %s", policy_number, customer_id)
+    t0 = perf_counter_ns()
 
     try:
-        conn = connect_db()
-        cursor = conn.cursor()
+        conn = get_pooled_connection()
 
         if policy_number:
-            cursor.execute("""
-                SELECT b.*, p.premium_amount, p.billing_frequency
-                FROM billing b
-                JOIN policies p ON b.policy_number = p.policy_number
-                WHERE b.policy_number = ? AND b.status = 'pending'
-                ORDER BY b.due_date DESC LIMIT 1
-            """, (policy_number,))
-        elif customer_id:
-            cursor.execute("""
-                SELECT b.*, p.premium_amount, p.billing_frequency
-                FROM billing b
-                JOIN policies p ON b.policy_number = p.policy_number
-                WHERE p.customer_id = ? AND b.status = 'pending'
-                ORDER BY b.due_date DESC LIMIT 1
-            """, (customer_id,))
+            cursor = conn.execute(SQL_BILLING_BY_POLICY, (policy_number,))
         else:
-            conn.close()
-            return {"error": "Either policy_number or customer_id must be provided"}
+            cursor = conn.execute(SQL_BILLING_BY_CUSTOMER, (customer_id,))
 
         result = cursor.fetchone()
-        conn.close()
 
-        duration = time.time() - start_time
-        metrics.db_query_duration_seconds.labels(
-            operation="select", table="billing"
-        ).observe(duration)
+        duration = (perf_counter_ns() - t0) / 1e9
+        _BILLING_DUR.observe(duration)
 
         if result:
             logger.info("✅ Billing info found")
-            metrics.db_queries_total.labels(
-                operation="select", table="billing", status="success"
-            ).inc()
-
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, result))
+            _BILLING_OK.inc()
+            return dict(result)
         else:
             logger.warning("❌ Billing info not found")
-            metrics.db_queries_total.labels(
-                operation="select", table="billing", status="not_found"
-            ).inc()
+            _BILLING_MISS.inc()
             return {"error": "Billing information not found"}
 
     except Exception as e:
-        logger.error(f"Database error fetching billing info: {e}", exc_info=True)
-        metrics.db_queries_total.labels(
-            operation="select", table="billing", status="error"
-        ).inc()
+        logger.error("Database error fetching billing info: %s", e, exc_info=True)
+        _BILLING_ERR.inc()
         return {"error": f"Database error: {str(e)}"}
 
 
@@ -92,47 +108,73 @@ def get_payment_history(policy_number: str) -> List[Dict[str, Any]]:
     Returns:
         List of payment records or empty list
     """
-    logger.info(f"🔍 Fetching payment history for policy: {policy_number}")
-    start_time = time.time()
+    logger.info("🔍 Fetching payment history for policy: %s", policy_number)
+    t0 = perf_counter_ns()
 
     try:
-        conn = connect_db()
-        cursor = conn.cursor()
+        conn = get_pooled_connection()
+        results = conn.execute(SQL_PAYMENTS_BY_POLICY, (policy_number,)).fetchall()
 
-        cursor.execute("""
-            SELECT p.payment_date, p.amount, p.status, p.payment_method
-            FROM payments p
-            JOIN billing b ON p.bill_id = b.bill_id
-            WHERE b.policy_number = ?
-            ORDER BY p.payment_date DESC LIMIT 10
-        """, (policy_number,))
-
-        results = cursor.fetchall()
-        conn.close()
-
-        duration = time.time() - start_time
-        metrics.db_query_duration_seconds.labels(
-            operation="select", table="payments"
-        ).observe(duration)
+        duration = (perf_counter_ns() - t0) / 1e9
+        _PAYMENTS_DUR.observe(duration)
 
         if results:
-            logger.info(f"✅ Found {len(results)} payment records")
-            metrics.db_queries_total.labels(
-                operation="select", table="payments", status="success"
-            ).inc()
-
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
+            logger.info("✅ Found %s payment records", len(results))
+            _PAYMENTS_OK.inc()
+            return [dict(row) for row in results]
         else:
             logger.warning("❌ No payment history found")
-            metrics.db_queries_total.labels(
-                operation="select", table="payments", status="not_found"
-            ).inc()
+            _PAYMENTS_MISS.inc()
             return []
 
     except Exception as e:
-        logger.error(f"Database error fetching payment history: {e}", exc_info=True)
-        metrics.db_queries_total.labels(
-            operation="select", table="payments", status="error"
-        ).inc()
+        logger.error("Database error fetching payment history: %s", e, exc_info=True)
+        _PAYMENTS_ERR.inc()
         return []
+
+
+@trace_function(name="get_billing_and_payments", attributes={"db.operation": "select", "db.table": "billing"})
+def get_billing_and_payments(policy_number: str) -> Dict[str, Any]:
+    """
+    Get current billing information and payment history for a policy in one call.
+
+    Runs both lookups back-to-back on the same connection instead of going
+    through get_billing_info and get_payment_history separately.
+
+    Args:
+        policy_number: Policy number to lookup
+
+    Returns:
+        Dictionary with ``billing`` (shaped like get_billing_info) and
+        ``payments`` (list), or error
+    """
+    if not is_valid_identifier(policy_number):
+        return {"error": f"Invalid policy number: {policy_number}"}
+
+    logger.info("🔍 Fetching billing and payments for policy: %s", policy_number)
+    t0 = perf_counter_ns()
+
+    try:
+        conn = get_pooled_connection()
+        billing = conn.execute(SQL_BILLING_BY_POLICY, (policy_number,)).fetchone()
+        payments = conn.execute(SQL_PAYMENTS_BY_POLICY, (policy_number,)).fetchall()
+
+        duration = (perf_counter_ns() - t0) / 1e9
+        _BILLING_DUR.observe(duration)
+
+        (_BILLING_OK if billing else _BILLING_MISS).inc()
+        (_PAYMENTS_OK if payments else _PAYMENTS_MISS).inc()
+        logger.info(
+            "✅ Billing for %s: billing=%s, %s payment(s)",
+            policy_number, "yes" if billing else "no", len(payments),
+        )
+
+        return {
+            "billing": dict(billing) if billing else {"error": "Billing information not found"},
+            "payments": [dict(row) for row in payments],
+        }
+
+    except Exception as e:
+        logger.error("Database error fetching billing and payments: %s", e, exc_info=True)
+        _BILLING_ERR.inc()
+        return {"error": f"Database error: {str(e)}"}
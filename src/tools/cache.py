@@ -0,0 +1,70 @@
+"""
+Short-lived in-process memoization for read-only tool lookups.
+"""
+import copy
+import functools
+import threading
+from typing import Any, Callable
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from src.config import settings
+from src.observability import metrics
+
+
+def ttl_memoize(table: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache successful results of a lookup for TOOL_CACHE_TTL_SECONDS.
+
+    Results are keyed on the call arguments. Error results (a dict with an
+    ``"error"`` key, e.g. not found or database errors) are never cached.
+    Callers get a deep copy, so mutating a result (including nested dicts
+    such as get_full_auto_policy's ``auto_details``) does not change the
+    cached value. Each decorated function has its own cache, and
+    ``func.invalidate(*args, **kwargs)`` drops a single entry.
+
+    Args:
+        table: Table label for the cache hit/miss metrics
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if settings.TOOL_CACHE_TTL_SECONDS <= 0:
+            return func
+
+        cache: TTLCache = TTLCache(
+            maxsize=settings.TOOL_CACHE_SIZE,
+            ttl=settings.TOOL_CACHE_TTL_SECONDS,
+        )
+        lock = threading.Lock()
+        hits = metrics.db_cache_hits_total.labels(table=table)
+        misses = metrics.db_cache_misses_total.labels(table=table)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = hashkey(*args, **kwargs)
+            with lock:
+                cached = cache.get(key)
+            if cached is not None:
+                hits.inc()
+                return copy.deepcopy(cached)
+
+            misses.inc()
+            result = func(*args, **kwargs)
+            if not (isinstance(result, dict) and "error" in result):
+                with lock:
+                    cache[key] = copy.deepcopy(result)
+            return result
+
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            """Drop the cached result for these call arguments, if any."""
+            with lock:
+                cache.pop(hashkey(*args, **kwargs), None)
+
+        wrapper.cache = cache
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
@@ -1,15 +1,53 @@
 """
 Claims-related tools for querying claim status and information.
 """
-import time
+from time import perf_counter_ns
 from typing import Dict, Any, List
-from src.database.connection import connect_db
+from src.database.connection import get_pooled_connection
+from src.tools.validation import MAX_IN_PARAMS, is_valid_identifier
 from src.observability.logging_config import get_logger
 from src.observability.tracing import trace_function
 from src.observability import metrics
 
 logger = get_logger(__name__)
 
+# Labeled query metrics, resolved once instead of per call
+_CLAIMS_OK = metrics.db_queries_total.labels(operation="select", table="claims", status="success")
+_CLAIMS_MISS = metrics.db_queries_total.labels(operation="select", table="claims", status="not_found")
+_CLAIMS_ERR = metrics.db_queries_total.labels(operation="select", table="claims", status="error")
+_CLAIMS_DUR = metrics.db_query_duration_seconds.labels(operation="select", table="claims")
+
+SQL_CLAIM_BY_ID = """
+    SELECT c.*, p.policy_type
+    FROM claims c
+    JOIN policies p ON c.policy_number = p.policy_number
+    WHERE c.claim_id = ?
+"""
+
+SQL_CLAIMS_BY_POLICY = """
+    SELECT c.*, p.policy_type
+    FROM claims c
+    JOIN policies p ON c.policy_number = p.policy_number
+    WHERE c.policy_number = ?
+    ORDER BY c.claim_date DESC LIMIT 3
+"""
+
+# Same rows as SQL_CLAIMS_BY_POLICY (latest 3 per policy) for a list of
+# policies; the window column _rank is dropped before returning
+SQL_CLAIMS_BY_POLICIES = """
+    SELECT * FROM (
+        SELECT c.*, p.policy_type,
+               ROW_NUMBER() OVER (
+                   PARTITION BY c.policy_number ORDER BY c.claim_date DESC
+               ) AS _rank
+        FROM claims c
+        JOIN policies p ON c.policy_number = p.policy_number
+        WHERE c.policy_number IN (%s)
+    )
+    WHERE _rank <= 3
+    ORDER BY policy_number, claim_date DESC
+"""
+
 
 @trace_function(name="get_claim_status", attributes={"db.operation": "select", "db.table": "claims"})
 def get_claim_status(claim_id: str = None, policy_number: str = None) -> Dict[str, Any]:
@@ -23,73 +61,93 @@ def get_claim_status(claim_id: str = None, policy_number: str = None) -> Dict[st
     Returns:
         Dictionary or list containing claim information
     """
-    logger.info(f"🔍 Fetching claim status - Claim ID: {claim_id}, Policy: {policy_number}")
-    start_time = time.time()
+    # Reject unusable input before touching the database
+    if not claim_id and not policy_number:
+        return {"error": "Either claim_id or policy_number must be provided"}
+    if claim_id and not is_valid_identifier(claim_id):
+        return {"error": f"Invalid claim ID: {claim_id}"}
+    if not claim_id and not is_valid_identifier(policy_number):
+        return {"error": f"Invalid policy number: {policy_number}"}
+
+    logger.info("🔍 Fetching claim status - Claim ID: %s, Policy: %s", claim_id, policy_number)
+    t0 = perf_counter_ns()
 
     try:
-        conn = connect_db()
-        cursor = conn.cursor()
+        conn = get_pooled_connection()
 
+        # Two statements so each lookup stays an index search; a single
+        # "(? IS NULL OR col = ?)" query makes SQLite scan the claims table
         if claim_id:
-            cursor.execute("""
-                SELECT c.*, p.policy_type
-                FROM claims c
-                JOIN policies p ON c.policy_number = p.policy_number
-                WHERE c.claim_id = ?
-            """, (claim_id,))
-            result = cursor.fetchone()
-
-            duration = time.time() - start_time
-            metrics.db_query_duration_seconds.labels(
-                operation="select", table="claims"
-            ).observe(duration)
-
-            if result:
-                logger.info(f"✅ Claim found: {claim_id}")
-                metrics.db_queries_total.labels(
-                    operation="select", table="claims", status="success"
-                ).inc()
-
-                columns = [desc[0] for desc in cursor.description]
-                conn.close()
-                return dict(zip(columns, result))
-
-        elif policy_number:
-            cursor.execute("""
-                SELECT c.*, p.policy_type
-                FROM claims c
-                JOIN policies p ON c.policy_number = p.policy_number
-                WHERE c.policy_number = ?
-                ORDER BY c.claim_date DESC LIMIT 3
-            """, (policy_number,))
-            results = cursor.fetchall()
-
-            duration = time.time() - start_time
-            metrics.db_query_duration_seconds.labels(
-                operation="select", table="claims"
-            ).observe(duration)
-
-            if results:
-                logger.info(f"✅ Found {len(results)} claim(s)")
-                metrics.db_queries_total.labels(
-                    operation="select", table="claims", status="success"
-                ).inc()
-
-                columns = [desc[0] for desc in cursor.description]
-                conn.close()
-                return [dict(zip(columns, row)) for row in results]
-
-        conn.close()
+            sql, params = SQL_CLAIM_BY_ID, (claim_id,)
+        else:
+            sql, params = SQL_CLAIMS_BY_POLICY, (policy_number,)
+        results = conn.execute(sql, params).fetchall()
+
+        duration = (perf_counter_ns() - t0) / 1e9
+        _CLAIMS_DUR.observe(duration)
+
+        if results:
+            logger.info("✅ Found %s claim(s)", len(results))
+            _CLAIMS_OK.inc()
+            return dict(results[0]) if claim_id else [dict(row) for row in results]
 
         logger.warning("❌ No claims found")
-        metrics.db_queries_total.labels(
-            operation="select", table="claims", status="not_found"
-        ).inc()
+        _CLAIMS_MISS.inc()
         return {"error": "Claim not found"}
 
     except Exception as e:
-        logger.error(f"Database error fetching claim status: {e}", exc_info=True)
-        metrics.db_queries_total.labels(
-            operation="select", table="claims", status="error"
-        ).inc()
+        logger.error("Database error fetching claim status: %s", e, exc_info=True)
+        _CLAIMS_ERR.inc()
+        return {"error": f"Database error: {str(e)}"}
+
+
+@trace_function(name="get_claims_by_policies", attributes={"db.operation": "select", "db.table": "claims"})
+def get_claims_by_policies(policy_numbers: List[str]) -> Dict[str, Any]:
+    """
+    Get recent claims for several policies with one query per 500 policies.
+
+    Args:
+        policy_numbers: Policy numbers to find claims for
+
+    Returns:
+        Dictionary mapping each valid policy number to its latest claims
+        (up to 3, empty if none), or error
+    """
+    # dict.fromkeys drops duplicates and keeps the requested order
+    policy_numbers = list(dict.fromkeys(policy_numbers))
+    invalid = [pn for pn in policy_numbers if not is_valid_identifier(pn)]
+    if invalid:
+        return {"error": f"Invalid policy number: {', '.join(map(str, invalid))}"}
+
+    logger.info("🔍 Fetching claims for %s policies", len(policy_numbers))
+
+    if not policy_numbers:
+        return {}
+
+    t0 = perf_counter_ns()
+
+    try:
+        conn = get_pooled_connection()
+        claims: Dict[str, List[Dict[str, Any]]] = {pn: [] for pn in policy_numbers}
+
+        for i in range(0, len(policy_numbers), MAX_IN_PARAMS):
+            chunk = policy_numbers[i:i + MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(SQL_CLAIMS_BY_POLICIES % placeholders, chunk):
+                claim = dict(row)
+                del claim["_rank"]
+                claims[claim["policy_number"]].append(claim)
+
+        duration = (perf_counter_ns() - t0) / 1e9
+        _CLAIMS_DUR.observe(duration)
+
+        found = sum(1 for rows in claims.values() if rows)
+        logger.info("✅ Found claims for %s of %s policies", found, len(policy_numbers))
+        (_CLAIMS_OK if found else _CLAIMS_MISS).inc()
+
+        return claims
+
+    except Exception as e:
+        logger.error("Database error fetching claims for %s: %s", policy_numbers, e, exc_info=True)
+        _CLAIMS_ERR.inc()
         return {"error": f"Database error: {str(e)}"}
@@ -1,17 +1,62 @@
 """
 Policy-related tools for querying policy information.
 """
-import time
-from typing import Dict, Any
-from src.database.connection import connect_db
+from time import perf_counter_ns
+from typing import Dict, Any, List
+from src.database.connection import get_pooled_connection
+from src.tools.cache import ttl_memoize
+from src.tools.validation import MAX_IN_PARAMS, is_valid_identifier
 from src.observability.logging_config import get_logger
 from src.observability.tracing import trace_function
 from src.observability import metrics
 
 logger = get_logger(__name__)
 
+# Labeled query metrics, resolved once instead of per call
+_POLICIES_OK = metrics.db_queries_total.labels(operation="select", table="policies", status="success")
+_POLICIES_MISS = metrics.db_queries_total.labels(operation="select", table="policies", status="not_found")
+_POLICIES_ERR = metrics.db_queries_total.labels(operation="select", table="policies", status="error")
+_POLICIES_DUR = metrics.db_query_duration_seconds.labels(operation="select", table="policies")
+_AUTO_OK = metrics.db_queries_total.labels(operation="select", table="auto_policy_details", status="success")
+_AUTO_MISS = metrics.db_queries_total.labels(operation="select", table="auto_policy_details", status="not_found")
+_AUTO_ERR = metrics.db_queries_total.labels(operation="select", table="auto_policy_details", status="error")
+_AUTO_DUR = metrics.db_query_duration_seconds.labels(operation="select", table="auto_policy_details")
+
+SQL_POLICY_DETAILS = """
+    SELECT p.*, c.first_name, c.last_name
+    FROM policies p
+    JOIN customers c ON p.customer_id = c.customer_id
+    WHERE p.policy_number = ?
+"""
+
+SQL_POLICY_DETAILS_MANY = """
+    SELECT p.*, c.first_name, c.last_name
+    FROM policies p
+    JOIN customers c ON p.customer_id = c.customer_id
+    WHERE p.policy_number IN (%s)
+"""
+
+SQL_AUTO_POLICY_DETAILS = """
+    SELECT apd.*, p.policy_type, p.premium_amount
+    FROM auto_policy_details apd
+    JOIN policies p ON apd.policy_number = p.policy_number
+    WHERE apd.policy_number = ?
+"""
+
+# _has_auto separates the policy columns from the auto_policy_details columns
+# (both tables have policy_number) and flags whether the LEFT JOIN matched
+SQL_FULL_AUTO_POLICY = """
+    SELECT p.*, c.first_name, c.last_name,
+           apd.policy_number IS NOT NULL AS _has_auto, apd.*
+    FROM policies p
+    JOIN customers c ON p.customer_id = c.customer_id
+    LEFT JOIN auto_policy_details apd ON apd.policy_number = p.policy_number
+    WHERE p.policy_number = ?
+"""
+
 
 @trace_function(name="get_policy_details", attributes={"db.operation": "select", "db.table": "policies"})
+@ttl_memoize("policies")
 def get_policy_details(policy_number: str) -> Dict[str, Any]:
     """
     Fetch a customer's policy details by policy number.
@@ -22,53 +67,91 @@ def get_policy_details(policy_number: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing policy details or error
     """
-    logger.info(f"🔍 Fetching policy details for: {policy_number}")
-    start_time = time.time()
+    logger.info("🔍 Fetching policy details for: %s", policy_number)
+    t0 = perf_counter_ns()
 
     try:
-        conn = connect_db()
-        cursor = conn.cursor()
+        conn = get_pooled_connection()
+        result = conn.execute(SQL_POLICY_DETAILS, (policy_number,)).fetchone()
 
-        cursor.execute("""
-            SELECT p.*, c.first_name, c.last_name
-            FROM policies p
-            JOIN customers c ON p.customer_id = c.customer_id
-            WHERE p.policy_number = ?
-        """, (policy_number,))
-
-        result = cursor.fetchone()
-        conn.close()
-
-        duration = time.time() - start_time
-        metrics.db_query_duration_seconds.labels(
-            operation="select", table="policies"
-        ).observe(duration)
+        duration = (perf_counter_ns() - t0) / 1e9
+        _POLICIES_DUR.observe(duration)
 
         if result:
-            logger.info(f"✅ Policy found: {policy_number}")
-            metrics.db_queries_total.labels(
-                operation="select", table="policies", status="success"
-            ).inc()
-
-            # Convert Row object to dict
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, result))
+            logger.info("✅ Policy found: %s", policy_number)
+            _POLICIES_OK.inc()
+            return dict(result)
         else:
-            logger.warning(f"❌ Policy not found: {policy_number}")
-            metrics.db_queries_total.labels(
-                operation="select", table="policies", status="not_found"
-            ).inc()
+            logger.warning("❌ Policy not found: %s", policy_number)
+            _POLICIES_MISS.inc()
             return {"error": "Policy not found"}
 
     except Exception as e:
-        logger.error(f"Database error fetching policy {policy_number}: {e}", exc_info=True)
-        metrics.db_queries_total.labels(
-            operation="select", table="policies", status="error"
-        ).inc()
+        logger.error("Database error fetching policy %s: %s", policy_number, e, exc_info=True)
+        _POLICIES_ERR.inc()
         return {"error": f"Database error: {str(e)}"}
 
 
+@trace_function(name="get_policy_details_many", attributes={"db.operation": "select", "db.table": "policies"})
+def get_policy_details_many(policy_numbers: List[str]) -> Dict[str, Any]:
+    """
+    Fetch policy details for several policy numbers with one query per 500.
+
+    Args:
+        policy_numbers: Policy numbers to lookup
+
+    Returns:
+        Dictionary mapping each requested policy number to its details or
+        error, or an error if any policy number is malformed
+    """
+    # dict.fromkeys drops duplicates and keeps the requested order
+    policy_numbers = list(dict.fromkeys(policy_numbers))
+    invalid = [pn for pn in policy_numbers if not is_valid_identifier(pn)]
+    if invalid:
+        return {"error": f"Invalid policy number: {', '.join(map(str, invalid))}"}
+
+    logger.info("🔍 Fetching policy details for %s policies", len(policy_numbers))
+
+    if not policy_numbers:
+        return {}
+
+    t0 = perf_counter_ns()
+
+    try:
+        conn = get_pooled_connection()
+        found = {}
+        for i in range(0, len(policy_numbers), MAX_IN_PARAMS):
+            chunk = policy_numbers[i:i + MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(SQL_POLICY_DETAILS_MANY % placeholders, chunk):
+                found[row["policy_number"]] = dict(row)
+
+        duration = (perf_counter_ns() - t0) / 1e9
+        _POLICIES_DUR.observe(duration)
+
+        logger.info("✅ Found %s of %s policies", len(found), len(policy_numbers))
+
+        if found:
+            _POLICIES_OK.inc()
+        else:
+            _POLICIES_MISS.inc()
+
+        return {
+            policy_number: found.get(policy_number, {"error": "Policy not found"})
+            for policy_number in policy_numbers
+        }
+
+    except Exception as e:
+        logger.error("Database error fetching policies %s: %s", policy_numbers, e, exc_info=True)
+        _POLICIES_ERR.inc()
+        return {
+            policy_number: {"error": f"Database error: {str(e)}"}
+            for policy_number in policy_numbers
+        }
+
+
 @trace_function(name="get_auto_policy_details", attributes={"db.operation": "select", "db.table": "auto_policy_details"})
+@ttl_memoize("auto_policy_details")
 def get_auto_policy_details(policy_number: str) -> Dict[str, Any]:
     """
     Get auto-specific policy details including vehicle info and deductibles.
@@ -79,46 +162,99 @@ def get_auto_policy_details(policy_number: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing auto policy details or error
     """
-    logger.info(f"🔍 Fetching auto policy details for: {policy_number}")
-    start_time = time.time()
+    logger.info("🔍 Fetching auto policy details for: %s", policy_number)
+    t0 = perf_counter_ns()
 
     try:
-        conn = connect_db()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT apd.*, p.policy_type, p.premium_amount
-            FROM auto_policy_details apd
-            JOIN policies p ON apd.policy_number = p.policy_number
-            WHERE apd.policy_number = ?
-        """, (policy_number,))
+        conn = get_pooled_connection()
+        result = conn.execute(SQL_AUTO_POLICY_DETAILS, (policy_number,)).fetchone()
 
-        result = cursor.fetchone()
-        conn.close()
-
-        duration = time.time() - start_time
-        metrics.db_query_duration_seconds.labels(
-            operation="select", table="auto_policy_details"
-        ).observe(duration)
+        duration = (perf_counter_ns() - t0) / 1e9
+        _AUTO_DUR.observe(duration)
 
         if result:
             logger.info("✅ Auto policy details found")
-            metrics.db_queries_total.labels(
-                operation="select", table="auto_policy_details", status="success"
-            ).inc()
-
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, result))
+            _AUTO_OK.inc()
+            return dict(result)
         else:
             logger.warning("❌ Auto policy details not found")
-            metrics.db_queries_total.labels(
-                operation="select", table="auto_policy_details", status="not_found"
-            ).inc()
+            _AUTO_MISS.inc()
             return {"error": "Auto policy details not found"}
 
     except Exception as e:
-        logger.error(f"Database error fetching auto policy {policy_number}: {e}", exc_info=True)
-        metrics.db_queries_total.labels(
-            operation="select", table="auto_policy_details", status="error"
-        ).inc()
+        logger.error("Database error fetching auto policy %s: %s", policy_number, e, exc_info=True)
+        _AUTO_ERR.inc()
         return {"error": f"Database error: {str(e)}"}
+
+
+@trace_function(name="get_full_auto_policy", attributes={"db.operation": "select", "db.table": "policies"})
+@ttl_memoize("full_auto_policy")
+def get_full_auto_policy(policy_number: str) -> Dict[str, Any]:
+    """
+    Get policy details and auto-specific details with a single query.
+
+    Equivalent to calling get_policy_details and get_auto_policy_details,
+    but joins policies, customers and auto_policy_details in one statement.
+
+    Args:
+        policy_number: Policy number to lookup
+
+    Returns:
+        Dictionary with ``policy`` and ``auto_details`` (each shaped like the
+        single lookups, auto_details carries an error if absent), or error
+    """
+    logger.info("🔍 Fetching full auto policy for: %s", policy_number)
+    t0 = perf_counter_ns()
+
+    try:
+        conn = get_pooled_connection()
+        cursor = conn.execute(SQL_FULL_AUTO_POLICY, (policy_number,))
+        result = cursor.fetchone()
+
+        duration = (perf_counter_ns() - t0) / 1e9
+        _POLICIES_DUR.observe(duration)
+
+        if not result:
+            logger.warning("❌ Policy not found: %s", policy_number)
+            _POLICIES_MISS.inc()
+            return {"error": "Policy not found"}
+
+        columns = [column[0] for column in cursor.description]
+        split = columns.index("_has_auto")
+        values = tuple(result)
+        policy = dict(zip(columns[:split], values[:split]))
+
+        if values[split]:
+            auto_details = dict(zip(columns[split + 1:], values[split + 1:]))
+            auto_details["policy_type"] = policy["policy_type"]
+            auto_details["premium_amount"] = policy["premium_amount"]
+        else:
+            auto_details = {"error": "Auto policy details not found"}
+
+        logger.info("✅ Policy found: %s (auto details: %s)", policy_number, "yes" if values[split] else "no")
+        _POLICIES_OK.inc()
+        return {"policy": policy, "auto_details": auto_details}
+
+    except Exception as e:
+        logger.error("Database error fetching full auto policy %s: %s", policy_number, e, exc_info=True)
+        _POLICIES_ERR.inc()
+        return {"error": f"Database error: {str(e)}"}
+
+
+def invalidate_policy(policy_number: str) -> None:
+    """
+    Drop cached lookups for a policy after it has been modified.
+
+    Tool calls from agents pass keyword arguments while direct callers
+    usually pass the policy number positionally; both cache entries go.
+
+    Args:
+        policy_number: Policy number whose cached details are stale
+    """
+    for lookup in (get_policy_details, get_auto_policy_details, get_full_auto_policy):
+        invalidate = getattr(lookup, "invalidate", None)
+        if invalidate is None:
+            # Caching is disabled (TOOL_CACHE_TTL_SECONDS <= 0)
+            continue
+        invalidate(policy_number)
+        invalidate(policy_number=policy_number)
@@ -1,36 +1,335 @@
 """
 User interaction tools for getting clarification.
 """
-from typing import Dict, Any
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from src.config import settings
 from src.observability.logging_config import get_logger
+from src.utils.redis_pool import get_connection_pool
 
 logger = get_logger(__name__)
 
 
-def ask_user(question: str, missing_info: str = "") -> Dict[str, Any]:
+@dataclass
+class PendingClarification:
+    """A clarification question waiting for the user's answer."""
+
+    question: str
+    missing_info: str
+    # Only set for questions waiting in this process (no Redis)
+    future: Optional[asyncio.Future] = None
+
+
+# Event loop serving the API. Without Redis, workflows run in worker threads
+# and hand clarification requests back to this loop instead of blocking on
+# stdin.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Open clarification requests when Redis is unavailable, keyed by session ID
+# (only touched on _loop)
+_pending: Dict[str, PendingClarification] = {}
+
+# Redis holding pending questions and answers so that any API worker can
+# answer a question asked by another; None until connected. After a failed
+# check the next attempt waits _redis_backoff seconds, doubling up to
+# _REDIS_BACKOFF_MAX.
+_redis: Optional[Redis] = None
+_redis_retry_at = 0.0
+_redis_backoff = 0.0
+_redis_lock = threading.Lock()
+
+_REDIS_BACKOFF_MIN = 1.0
+_REDIS_BACKOFF_MAX = 60.0
+
+
+def _get_redis() -> Optional[Redis]:
+    """
+    Get the Redis client for clarifications, connecting on first use.
+
+    Clarifications use their own connection pool because each waiting
+    question holds a connection for up to CLARIFICATION_TIMEOUT_SECONDS.
+
+    Returns:
+        Redis client, or None to keep clarifications in this process for now
+    """
+    global _redis, _redis_retry_at, _redis_backoff
+    if _redis is not None or time.monotonic() < _redis_retry_at:
+        return _redis
+
+    with _redis_lock:
+        if _redis is not None or time.monotonic() < _redis_retry_at:
+            return _redis
+        try:
+            client = Redis(
+                connection_pool=get_connection_pool(
+                    settings.REDIS_URL,
+                    purpose="clarifications",
+                    max_connections=settings.CLARIFICATION_REDIS_MAX_CONNECTIONS,
+                )
+            )
+            client.ping()
+            _redis = client
+            _redis_backoff = 0.0
+        except RedisError as e:
+            _redis_backoff = min(max(_redis_backoff * 2, _REDIS_BACKOFF_MIN), _REDIS_BACKOFF_MAX)
+            _redis_retry_at = time.monotonic() + _redis_backoff
+            logger.warning(
+                "⚠️ Redis not available, clarifications only work within this API worker "
+                "(retrying in %ss): %s", _redis_backoff, e
+            )
+    return _redis
+
+
+def _question_key(session_id: str) -> str:
+    """Get the Redis key of a session's pending question."""
+    return f"clarification:{session_id}"
+
+
+def _answer_key(session_id: str) -> str:
+    """Get the Redis key of the list the answer is pushed to."""
+    return f"clarification:{session_id}:answer"
+
+
+def bind_event_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Register the event loop that answers clarification requests.
+
+    Binding a loop also checks Redis, so the first clarification does not
+    wait on the connection check.
+
+    Args:
+        loop: The API's running event loop (None to unbind)
+    """
+    global _loop
+    _loop = loop
+    if loop is not None:
+        _get_redis()
+
+
+async def ask_user_async(
+    session_id: str,
+    question: str,
+    missing_info: str = "",
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Wait in this process for the user's answer to a clarification question.
+
+    The question is registered under the session ID and the coroutine
+    suspends until submit_clarification() delivers an answer, so waiting
+    does not occupy a worker thread or the event loop.
+
+    Args:
+        session_id: Session the question belongs to
+        question: The question to ask the user
+        missing_info: Description of what information is missing
+        timeout: Seconds to wait (defaults to CLARIFICATION_TIMEOUT_SECONDS)
+
+    Returns:
+        Dictionary with context and source; context is empty on timeout
+    """
+    logger.info("🗣️ Waiting for clarification on session %s: %s", session_id, question)
+
+    future = asyncio.get_running_loop().create_future()
+    pending = PendingClarification(question=question, missing_info=missing_info, future=future)
+    _pending[session_id] = pending
+
+    if timeout is None:
+        timeout = settings.CLARIFICATION_TIMEOUT_SECONDS
+
+    try:
+        answer = await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        logger.warning("⏱️ No clarification received for session %s within %ss", session_id, timeout)
+        answer = ""
+    finally:
+        # A newer question may have replaced this one meanwhile
+        if _pending.get(session_id) is pending:
+            del _pending[session_id]
+
+    return {"context": answer, "source": "User Input"}
+
+
+def _ask_user_redis(
+    redis: Redis,
+    session_id: str,
+    question: str,
+    missing_info: str = "",
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Publish a clarification question in Redis and wait for the answer.
+
+    The answer is popped with BLPOP in steps shorter than the Redis socket
+    timeout, so it can be posted to any API worker.
+
+    Args:
+        redis: Redis client
+        session_id: Session the question belongs to
+        question: The question to ask the user
+        missing_info: Description of what information is missing
+        timeout: Seconds to wait (defaults to CLARIFICATION_TIMEOUT_SECONDS)
+
+    Returns:
+        Dictionary with context and source; context is empty on timeout
+    """
+    logger.info("🗣️ Waiting for clarification on session %s: %s", session_id, question)
+
+    if timeout is None:
+        timeout = settings.CLARIFICATION_TIMEOUT_SECONDS
+
+    question_key = _question_key(session_id)
+    answer_key = _answer_key(session_id)
+    ttl_seconds = math.ceil(timeout) + 1
+
+    answer = ""
+    try:
+        with redis.pipeline() as pipe:
+            pipe.delete(answer_key)
+            pipe.hset(question_key, mapping={"question": question, "missing_info": missing_info})
+            pipe.expire(question_key, ttl_seconds)
+            pipe.execute()
+
+        step = max(1, settings.REDIS_SOCKET_TIMEOUT - 1)
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            popped = redis.blpop([answer_key], timeout=min(step, remaining))
+            if popped is not None:
+                answer = popped[1].decode()
+                break
+        else:
+            logger.warning("⏱️ No clarification received for session %s within %ss", session_id, timeout)
+
+    except RedisError as e:
+        logger.error("Error waiting for clarification on session %s: %s", session_id, e, exc_info=True)
+
+    finally:
+        try:
+            redis.delete(question_key, answer_key)
+        except RedisError:
+            pass
+
+    return {"context": answer, "source": "User Input"}
+
+
+def get_pending_clarification(session_id: str) -> Optional[PendingClarification]:
+    """
+    Get the clarification question a session is waiting on, if any.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        The pending clarification, or None
+    """
+    # Questions asked while Redis was unavailable wait in this process
+    pending = _pending.get(session_id)
+    if pending is not None and not pending.future.done():
+        return pending
+
+    redis = _get_redis()
+    if redis is not None:
+        try:
+            stored = redis.hgetall(_question_key(session_id))
+        except RedisError as e:
+            logger.error("Error reading clarification for session %s: %s", session_id, e)
+            return None
+        if not stored:
+            return None
+        return PendingClarification(
+            question=stored[b"question"].decode(),
+            missing_info=stored.get(b"missing_info", b"").decode(),
+        )
+
+    return None
+
+
+def submit_clarification(session_id: str, answer: str) -> bool:
+    """
+    Deliver the user's answer to a waiting clarification request.
+
+    Without Redis this must be called from the bound event loop (e.g. an
+    async route handler) of the process that asked the question.
+
+    Args:
+        session_id: Session identifier
+        answer: The user's answer
+
+    Returns:
+        True if a waiting request received the answer
+    """
+    pending = get_pending_clarification(session_id)
+    if pending is None:
+        return False
+
+    if pending.future is not None:
+        pending.future.set_result(answer)
+        return True
+
+    redis = _get_redis()
+    if redis is not None:
+        try:
+            with redis.pipeline() as pipe:
+                pipe.rpush(_answer_key(session_id), answer)
+                pipe.expire(_answer_key(session_id), math.ceil(settings.CLARIFICATION_TIMEOUT_SECONDS) + 1)
+                pipe.execute()
+        except RedisError as e:
+            logger.error("Error submitting clarification for session %s: %s", session_id, e)
+            return False
+        return True
+
+    return False
+
+
+def ask_user(question: str, missing_info: str = "", session_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Ask the user for input and return the response.
 
-    Note: In production API, this should trigger a clarification response
-    rather than blocking for input. This function is primarily for
-    testing and development.
+    Under the API (an event loop is bound and a session ID is given) the
+    question is published for the clarify endpoint and this thread waits
+    for the answer: through Redis when it is available, so any API worker
+    can take the answer, otherwise through ask_user_async() on the bound
+    event loop, which only works with a single worker. Otherwise the answer
+    is read from stdin, which only happens in development.
 
     Args:
         question: The question to ask the user
         missing_info: Description of what information is missing
+        session_id: Session the question belongs to
 
     Returns:
         Dictionary with context and source
     """
-    logger.info(f"🗣️ Asking user for input: {question}")
+    if session_id and _loop is not None and _loop.is_running():
+        redis = _get_redis()
+        if redis is not None:
+            return _ask_user_redis(redis, session_id, question, missing_info)
+
+        future = asyncio.run_coroutine_threadsafe(
+            ask_user_async(session_id, question, missing_info), _loop
+        )
+        return future.result()
+
+    if settings.ENVIRONMENT != "development":
+        # Never block a server worker on stdin
+        logger.warning("⚠️ Cannot ask user interactively in %s: %s", settings.ENVIRONMENT, question)
+        return {"context": "", "source": "User Input"}
+
+    logger.info("🗣️ Asking user for input: %s", question)
 
     if missing_info:
         print(f"---USER INPUT REQUIRED---\nMissing information: {missing_info}")
     else:
         print(f"---USER INPUT REQUIRED---")
 
-    # In production, this would not block but return a flag
-    # indicating clarification is needed
     answer = input(f"{question}: ")
 
     return {"context": answer, "source": "User Input"}
@@ -0,0 +1,28 @@
+"""
+Input checks shared by the database tools.
+"""
+import re
+
+# Record identifiers are an upper-case prefix plus a zero-padded number,
+# e.g. POL000004, CUST00001, CLM000001
+_IDENTIFIER_RE = re.compile(r"^[A-Z]{3,4}\d{5,}$")
+
+# Most identifiers bound into one IN (...) list; stays well under SQLite's
+# bound-parameter limit (999 on older builds)
+MAX_IN_PARAMS = 500
+
+
+def is_valid_identifier(value: str) -> bool:
+    """
+    Check that a value has the shape of a record identifier.
+
+    Lets tools reject placeholders such as "unknown" or "N/A" without a
+    database round-trip; values that pass may still not exist.
+
+    Args:
+        value: Identifier supplied by the caller
+
+    Returns:
+        True if the value looks like an identifier
+    """
+    return isinstance(value, str) and _IDENTIFIER_RE.match(value) is not None
@@ -2,8 +2,17 @@
 OpenAI client wrapper with tracing and error handling.
 """
 from openai import OpenAI
+import atexit
+import contextvars
+import hashlib
+import httpx
 import json
-from typing import List, Dict, Any, Optional
+import logging
+import msgspec
+import threading
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Union
 import time
 
 from src.config import settings
@@ -13,6 +22,97 @@ from src.observability import metrics
 
 logger = get_logger(__name__)
 
+# Shared pool for running independent tool calls concurrently. Long-lived
+# threads also keep their per-thread SQLite connections between requests.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.TOOL_EXECUTOR_WORKERS, thread_name_prefix="llm-tool"
+)
+
+# Responses to deterministic requests (temperature 0, no tools executed),
+# keyed by a hash of the request. Messages are stored as private copies.
+_response_cache: Optional[TTLCache] = None
+if settings.LLM_CACHE_TTL_SECONDS > 0:
+    _response_cache = TTLCache(maxsize=settings.LLM_CACHE_SIZE, ttl=settings.LLM_CACHE_TTL_SECONDS)
+_response_cache_lock = threading.Lock()
+
+# Tool-call arguments and tool results cross this boundary on every tool
+# round; msgspec's C codec is several times faster than the stdlib here
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+
+def _dump_tool_result(result: Any) -> str:
+    """Serialize a tool result for the follow-up message."""
+    try:
+        return _JSON_ENCODER.encode(result).decode()
+    except TypeError:
+        # Types msgspec doesn't know (e.g. numpy scalars) take the stdlib path
+        return json.dumps(result)
+
+
+# Pre-bound (prompt, completion) token counters per model
+_token_counters: Dict[str, tuple] = {}
+
+
+def _record_token_usage(model: str, usage: Any) -> None:
+    """Count prompt and completion tokens; the total is their sum."""
+    counters = _token_counters.get(model)
+    if counters is None:
+        counters = _token_counters.setdefault(model, (
+            metrics.llm_tokens_used_total.labels(model=model, token_type="prompt"),
+            metrics.llm_tokens_used_total.labels(model=model, token_type="completion"),
+        ))
+    counters[0].inc(usage.prompt_tokens)
+    counters[1].inc(usage.completion_tokens)
+
+
+def _optional_params(
+    tools: Optional[List[Dict]] = None, max_tokens: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Build the optional chat-completion parameters that are actually set.
+
+    The SDK serializes explicit ``None`` values as JSON nulls, so leaving
+    unset parameters out keeps tool-free requests free of tools/tool_choice.
+    """
+    params: Dict[str, Any] = {}
+    if tools:
+        params["tools"] = tools
+        params["tool_choice"] = "auto"
+    if max_tokens is not None:
+        params["max_tokens"] = max_tokens
+    return params
+
+
+def _request_key(**request: Any) -> str:
+    """Hash a request's parameters into a response cache key."""
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_get(key: Optional[str], model: str) -> Any:
+    """Look up a cached response (None on miss or when caching is off)."""
+    if key is None or _response_cache is None:
+        return None
+
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+
+    if cached is None:
+        metrics.llm_cache_misses_total.labels(model=model).inc()
+    else:
+        metrics.llm_cache_hits_total.labels(model=model).inc()
+    return cached
+
+
+def _cache_set(key: Optional[str], response: Any) -> None:
+    """Store a response in the cache (no-op when caching is off)."""
+    if key is None or _response_cache is None or response is None:
+        return
+
+    with _response_cache_lock:
+        _response_cache[key] = response
+
 
 class LLMClient:
     """
@@ -21,14 +121,97 @@ class LLMClient:
 
     def __init__(self):
         """Initialize the OpenAI client."""
+        # Keep connections to the API alive (and multiplexed over HTTP/2)
+        # across requests instead of paying a TLS handshake per call
+        self._http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                keepalive_expiry=60.0,
+            ),
+            timeout=settings.OPENAI_TIMEOUT,
+        )
+        atexit.register(self._http_client.close)
+
         self.client = OpenAI(
             api_key=settings.OPENAI_API_KEY,
             timeout=settings.OPENAI_TIMEOUT,
             max_retries=settings.OPENAI_MAX_RETRIES,
+            http_client=self._http_client,
         )
         self.model = settings.OPENAI_MODEL
         logger.info(f"LLM client initialized with model: {self.model}")
 
+    @trace_function(name="llm_single_completion", attributes={"llm.provider": "openai"})
+    def complete(
+        self,
+        prompt: str,
+        tools: Optional[List[Dict]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Any:
+        """
+        Run a single LLM request and return the model's message.
+
+        Unlike run_llm, tool calls are not executed; callers inspect
+        ``message.tool_calls`` and handle them themselves.
+
+        Args:
+            prompt: The system prompt to send
+            tools: Tool schema list for model function calling
+            model: Model name to use (defaults to config model)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The response message (content and optional tool_calls)
+        """
+        model = model or self.model
+
+        cache_key = None
+        if temperature == 0:
+            cache_key = _request_key(
+                call="complete", prompt=prompt, tools=tools, model=model, max_tokens=max_tokens
+            )
+            cached = _cache_get(cache_key, model)
+            if cached is not None:
+                logger.debug("LLM response served from cache")
+                # Callers may mutate the message; hand out a fresh copy
+                return cached.model_copy(deep=True)
+
+        start_time = time.time()
+
+        try:
+            logger.debug("Making LLM request to %s", model)
+            metrics.llm_requests_total.labels(model=model, status="started").inc()
+
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "system", "content": prompt}],
+                temperature=temperature,
+                **_optional_params(tools, max_tokens),
+            )
+
+            if hasattr(response, "usage") and response.usage:
+                _record_token_usage(model, response.usage)
+
+            duration = time.time() - start_time
+            metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
+            metrics.llm_requests_total.labels(model=model, status="success").inc()
+
+            message = response.choices[0].message
+            _cache_set(cache_key, message.model_copy(deep=True))
+            return message
+
+        except Exception as e:
+            duration = time.time() - start_time
+            metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
+            metrics.llm_requests_total.labels(model=model, status="error").inc()
+            logger.error(f"LLM request failed: {e}", exc_info=True)
+            raise
+
     @trace_function(name="llm_completion", attributes={"llm.provider": "openai"})
     def run_llm(
         self,
@@ -38,7 +221,8 @@ class LLMClient:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-    ) -> str:
+        stream: bool = False,
+    ) -> Union[str, Iterator[str]]:
         """
         Run an LLM request with optional tool calling support.
 
@@ -49,99 +233,122 @@ class LLMClient:
             model: Model name to use (defaults to config model)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            stream: Return an iterator of text chunks for the final answer
+                instead of waiting for the whole completion
 
         Returns:
-            Final LLM response text
+            Final LLM response text, or an iterator of its chunks if stream is set
         """
         model = model or self.model
+
+        # Only requests that cannot run tools are deterministic end to end
+        cache_key = None
+        if temperature == 0 and not tools and not stream:
+            cache_key = _request_key(
+                call="run_llm", prompt=prompt, model=model, max_tokens=max_tokens
+            )
+            cached = _cache_get(cache_key, model)
+            if cached is not None:
+                logger.debug("LLM response served from cache")
+                return cached
+
         start_time = time.time()
 
         try:
             # Step 1: Initial LLM call
-            logger.debug(f"Making LLM request to {model}")
+            logger.debug("Making LLM request to %s", model)
             metrics.llm_requests_total.labels(model=model, status="started").inc()
 
+            if stream and not tools:
+                # No tool calls are possible, so the first call is the answer
+                response = self.client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "system", "content": prompt}],
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **_optional_params(max_tokens=max_tokens),
+                )
+                return self._stream_content(response, model, start_time)
+
             response = self.client.chat.completions.create(
                 model=model,
                 messages=[{"role": "system", "content": prompt}],
-                tools=tools if tools else None,
-                tool_choice="auto" if tools else None,
                 temperature=temperature,
-                max_tokens=max_tokens,
+                **_optional_params(tools, max_tokens),
             )
 
             message = response.choices[0].message
 
             # Track token usage
             if hasattr(response, "usage") and response.usage:
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="prompt"
-                ).inc(response.usage.prompt_tokens)
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="completion"
-                ).inc(response.usage.completion_tokens)
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="total"
-                ).inc(response.usage.total_tokens)
-
-            logger.debug(f"Initial LLM response: {message}")
+                _record_token_usage(model, response.usage)
+
+            # Rendering a ChatCompletionMessage is costly; skip it unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Initial LLM response: %s", message)
 
             # Step 2: If no tools or no tool calls, return simple model response
             if not getattr(message, "tool_calls", None):
                 duration = time.time() - start_time
                 metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
                 metrics.llm_requests_total.labels(model=model, status="success").inc()
-                return message.content
+                _cache_set(cache_key, message.content)
+                return iter([message.content]) if stream else message.content
 
             # Step 3: Handle tool calls dynamically
             if not tool_functions:
                 logger.warning("Tool calls requested but no tool functions provided")
-                return message.content + "\n\n⚠️ No tool functions provided to execute tool calls."
+                content = message.content + "\n\n⚠️ No tool functions provided to execute tool calls."
+                return iter([content]) if stream else content
 
             logger.info(f"Processing {len(message.tool_calls)} tool call(s)")
-            tool_messages = []
-
-            for tool_call in message.tool_calls:
-                func_name = tool_call.function.name
-                args = json.loads(tool_call.function.arguments or "{}")
-                tool_fn = tool_functions.get(func_name)
 
-                logger.debug(f"Calling tool: {func_name} with args: {args}")
-
-                try:
-                    result = tool_fn(**args) if tool_fn else {"error": f"Tool '{func_name}' not implemented."}
-                    logger.debug(f"Tool {func_name} result: {result}")
-                except Exception as e:
-                    logger.error(f"Tool {func_name} failed: {e}", exc_info=True)
-                    result = {"error": str(e)}
-
-                tool_messages.append({
+            if len(message.tool_calls) == 1:
+                results = [self._run_tool(message.tool_calls[0], tool_functions)]
+            else:
+                # Tool calls are independent lookups; run them concurrently.
+                # Each task gets a copy of the current context so tool spans
+                # stay parented to this request's trace.
+                futures = [
+                    _TOOL_EXECUTOR.submit(
+                        contextvars.copy_context().run,
+                        self._run_tool,
+                        tool_call,
+                        tool_functions,
+                    )
+                    for tool_call in message.tool_calls
+                ]
+                results = [future.result() for future in futures]
+
+            tool_messages = [
+                {
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": json.dumps(result)
-                })
+                    "content": _dump_tool_result(result)
+                }
+                for tool_call, result in zip(message.tool_calls, results)
+            ]
 
             # Step 4: Second pass — send tool outputs back to the model
             logger.debug("Sending tool results back to LLM")
+            # The SDK message already has the assistant/tool_calls shape
             followup_messages = [
                 {"role": "system", "content": prompt},
-                {
-                    "role": "assistant",
-                    "content": message.content,
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": tc.type,
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            },
-                        } for tc in message.tool_calls
-                    ],
-                },
+                message.model_dump(exclude_none=True),
                 *tool_messages,
             ]
 
+            if stream:
+                final_response = self.client.chat.completions.create(
+                    model=model,
+                    messages=followup_messages,
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                return self._stream_content(final_response, model, start_time)
+
             final_response = self.client.chat.completions.create(
                 model=model,
                 messages=followup_messages,
@@ -150,22 +357,14 @@ class LLMClient:
 
             # Track additional token usage
             if hasattr(final_response, "usage") and final_response.usage:
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="prompt"
-                ).inc(final_response.usage.prompt_tokens)
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="completion"
-                ).inc(final_response.usage.completion_tokens)
-                metrics.llm_tokens_used_total.labels(
-                    model=model, token_type="total"
-                ).inc(final_response.usage.total_tokens)
+                _record_token_usage(model, final_response.usage)
 
             duration = time.time() - start_time
             metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
             metrics.llm_requests_total.labels(model=model, status="success").inc()
 
             final_content = final_response.choices[0].message.content
-            logger.debug(f"Final LLM response: {final_content}")
+            logger.debug("Final LLM response: %s", final_content)
 
             return final_content
 
@@ -176,19 +375,84 @@ class LLMClient:
             logger.error(f"LLM request failed: {e}", exc_info=True)
             raise
 
+    def _stream_content(self, response: Any, model: str, start_time: float) -> Iterator[str]:
+        """
+        Yield text chunks from a streamed completion and record its metrics.
+
+        Duration and token usage are recorded once the stream is exhausted.
+
+        Args:
+            response: Streamed completion returned by the OpenAI client
+            model: Model name for metric labels
+            start_time: Start of the run_llm call
+
+        Yields:
+            Content chunks as they arrive
+        """
+        try:
+            for chunk in response:
+                # With include_usage, the last chunk carries usage and no choices
+                if chunk.usage:
+                    _record_token_usage(model, chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            duration = time.time() - start_time
+            metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
+            metrics.llm_requests_total.labels(model=model, status="error").inc()
+            logger.error(f"LLM stream failed: {e}", exc_info=True)
+            raise
+
+        duration = time.time() - start_time
+        metrics.llm_request_duration_seconds.labels(model=model).observe(duration)
+        metrics.llm_requests_total.labels(model=model, status="success").inc()
+
+    def _run_tool(self, tool_call: Any, tool_functions: Dict[str, Any]) -> Any:
+        """
+        Execute a single tool call requested by the model.
+
+        Args:
+            tool_call: Tool call from the model response
+            tool_functions: Mapping of tool names to Python functions
+
+        Returns:
+            Tool result, or an error dictionary if the tool failed
+        """
+        func_name = tool_call.function.name
+        args = _JSON_DECODER.decode(tool_call.function.arguments or "{}")
+        tool_fn = tool_functions.get(func_name)
+
+        logger.debug("Calling tool: %s with args: %r", func_name, args)
+
+        try:
+            result = tool_fn(**args) if tool_fn else {"error": f"Tool '{func_name}' not implemented."}
+            logger.debug("Tool %s result: %r", func_name, result)
+        except Exception as e:
+            logger.error(f"Tool {func_name} failed: {e}", exc_info=True)
+            result = {"error": str(e)}
+
+        return result
+
 
 # Global client instance
 _client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
 
 
 def get_llm_client() -> LLMClient:
     """
     Get the global LLM client instance.
 
+    Construction (OpenAI client, HTTP/2 pool) happens once even when several
+    threads ask for the client concurrently.
+
     Returns:
         LLMClient instance
     """
     global _client
     if _client is None:
-        _client = LLMClient()
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
     return _client
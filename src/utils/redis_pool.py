@@ -0,0 +1,46 @@
+"""
+Shared Redis connection pools.
+"""
+from typing import Dict, Optional, Tuple
+
+from redis import BlockingConnectionPool
+
+from src.config import settings
+
+# Connection pools shared across the process, keyed by (purpose, URL)
+_connection_pools: Dict[Tuple[str, str], BlockingConnectionPool] = {}
+
+
+def get_connection_pool(
+    redis_url: str,
+    purpose: str = "sessions",
+    max_connections: Optional[int] = None,
+) -> BlockingConnectionPool:
+    """
+    Get the shared blocking connection pool for a Redis URL.
+
+    A blocking pool makes callers wait up to REDIS_POOL_BLOCKING_TIMEOUT
+    for a free connection under burst load instead of failing immediately.
+    Each purpose gets its own pool, so long blocking calls (clarification
+    BLPOPs) cannot use up the connections session reads and writes need.
+
+    Args:
+        redis_url: Redis connection URL
+        purpose: Name of the pool's user, e.g. "sessions"
+        max_connections: Pool size (defaults to REDIS_MAX_CONNECTIONS)
+
+    Returns:
+        BlockingConnectionPool instance
+    """
+    key = (purpose, redis_url)
+    pool = _connection_pools.get(key)
+    if pool is None:
+        pool = BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections or settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_BLOCKING_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        )
+        pool = _connection_pools.setdefault(key, pool)
+    return pool
@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures.
+
+Fixtures for heavy application objects are session-scoped so each one is
+created once per test run rather than once per test (once per worker when
+running in parallel with pytest-xdist).
+"""
+import pytest
+
+from src.config import settings as app_settings
+from src.database.connection import get_db_manager
+from src.graph.workflow import get_workflow
+from src.rag.vector_store import get_vector_store
+from src.utils.llm_client import get_llm_client
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker so runs without pytest-xdist don't warn."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the same group on one xdist worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Application settings."""
+    return app_settings
+
+
+@pytest.fixture(scope="session")
+def db_manager():
+    """Global database manager."""
+    return get_db_manager()
+
+
+@pytest.fixture(scope="session")
+def llm_client():
+    """Global LLM client (no API calls are made by the tests)."""
+    return get_llm_client()
+
+
+@pytest.fixture(scope="session")
+def vector_store():
+    """Global vector store manager; the Chroma client is opened once."""
+    return get_vector_store()
+
+
+@pytest.fixture(scope="session")
+def workflow():
+    """Global compiled workflow; the graph is built and compiled once."""
+    return get_workflow()
@@ -0,0 +1,222 @@
+"""
+Phase 1 verification tests.
+
+Checks that all core Phase 1 components work correctly:
+- Configuration management
+- Logging setup
+- Tracing initialization
+- Database connections
+- Vector store operations
+- Agent instantiation
+- Workflow construction
+- Tool execution
+
+Run with pytest, or via the wrapper script:
+    python test_phase1.py
+
+The tests are independent and can run in parallel with pytest-xdist:
+    python test_phase1.py -n auto --dist loadgroup
+
+Tests that touch the on-disk SQLite database or Chroma store share the
+"storage" xdist group so they run on the same worker.
+
+Set SKIP_OBSERVABILITY_TESTS=1 to skip the tracing, metrics and LLM client
+checks.
+"""
+import os
+
+import pytest
+
+from src.config import get_settings
+from src.observability.logging_config import setup_logging, get_logger
+from src.observability.tracing import initialize_tracing, trace_agent
+from src.observability import metrics
+from src.database.connection import connect_db
+from src.tools.policy_tools import get_policy_details
+from src.tools.billing_tools import get_billing_info
+from src.tools.claims_tools import get_claim_status
+from src.graph.state import create_initial_state, update_state, clear_clarification_state
+from src.graph.workflow import get_workflow
+from src.graph.routing import decide_next_agent
+from src.agents.supervisor import SupervisorAgent
+from src.agents.policy_agent import PolicyAgent
+from src.agents.billing_agent import BillingAgent
+from src.agents.claims_agent import ClaimsAgent
+from src.agents.general_help_agent import GeneralHelpAgent
+from src.agents.human_escalation import HumanEscalationAgent
+from src.agents.final_answer import FinalAnswerAgent
+from src.utils.llm_client import get_llm_client
+
+# Keeps tests that use the on-disk SQLite/Chroma files on one xdist worker
+storage = pytest.mark.xdist_group("storage")
+
+skip_observability = pytest.mark.skipif(
+    os.getenv("SKIP_OBSERVABILITY_TESTS") == "1",
+    reason="SKIP_OBSERVABILITY_TESTS=1",
+)
+
+
+def test_configuration(settings):
+    """Test configuration management."""
+    assert settings.APP_NAME
+    assert settings.APP_VERSION
+    assert settings.OPENAI_MODEL
+
+    # Test singleton
+    assert settings is get_settings(), "Settings should be singleton"
+
+
+def test_logging():
+    """Test logging setup."""
+    setup_logging(level="INFO", format_type="text")
+
+    logger = get_logger("test_phase1")
+    logger.info("Test info message")
+    logger.debug("Test debug message (should not appear at INFO level)")
+    logger.warning("Test warning message")
+
+
+@skip_observability
+def test_tracing():
+    """Test Phoenix tracing setup."""
+    # Returns None if Phoenix is disabled or not running, which is OK
+    initialize_tracing()
+
+    @trace_agent
+    def test_function(state):
+        return {"result": "success"}
+
+    result = test_function({"test": "data"})
+    assert result["result"] == "success"
+
+
+@storage
+def test_database(db_manager):
+    """Test database connection."""
+    # The database may not be populated yet; the manager must still work
+    try:
+        with db_manager.get_cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            cursor.fetchall()
+    except Exception:
+        pass
+
+    # Test legacy function
+    conn = connect_db()
+    conn.close()
+
+
+@storage
+@pytest.mark.parametrize(
+    "tool,kwargs",
+    [
+        (get_policy_details, {"policy_number": "TEST999999"}),
+        (get_billing_info, {"policy_number": "TEST999999"}),
+        (get_claim_status, {"claim_id": "TEST999999"}),
+    ],
+    ids=["policy", "billing", "claims"],
+)
+def test_tool_missing_data(tool, kwargs):
+    """Test tool functions handle missing data gracefully."""
+    result = tool(**kwargs)
+    assert "error" in result or "Error" in str(result) or result is None
+
+
+@storage
+def test_vector_store(vector_store):
+    """Test vector store operations."""
+    assert vector_store is not None
+
+    # The collection may not be populated yet
+    try:
+        count = vector_store.get_collection_count()
+    except Exception:
+        return
+
+    if count > 0:
+        results = vector_store.query("What is life insurance?", n_results=2)
+        formatted = vector_store.format_faq_context(results)
+        assert len(formatted) > 0
+
+
+def test_graph_state():
+    """Test GraphState and state management."""
+    state = create_initial_state(
+        user_input="What is my premium?",
+        customer_id="CUST00001",
+        policy_number="POL000001"
+    )
+    assert state["user_input"] == "What is my premium?"
+    assert state["customer_id"] == "CUST00001"
+    assert state["n_iteration"] == 0
+
+    # Test state update
+    state = update_state(state, next_agent="billing_agent", task="Get premium info")
+    assert state["next_agent"] == "billing_agent"
+    assert state["task"] == "Get premium info"
+
+    # Test clarification state clearing
+    state["needs_clarification"] = True
+    state["clarification_question"] = "What is your policy number?"
+    state = clear_clarification_state(state)
+    assert state["needs_clarification"] == False
+    assert state["clarification_question"] is None
+
+
+def test_agents():
+    """Test agent instantiation."""
+    agents = {
+        "SupervisorAgent": SupervisorAgent,
+        "PolicyAgent": PolicyAgent,
+        "BillingAgent": BillingAgent,
+        "ClaimsAgent": ClaimsAgent,
+        "GeneralHelpAgent": GeneralHelpAgent,
+        "HumanEscalationAgent": HumanEscalationAgent,
+        "FinalAnswerAgent": FinalAnswerAgent,
+    }
+
+    for name, agent_class in agents.items():
+        agent = agent_class()
+        assert agent.name is not None, name
+        assert agent.logger is not None, name
+
+
+def test_workflow(workflow):
+    """Test workflow construction."""
+    # get_workflow() builds the graph with create_workflow() and compiles it
+    assert workflow is not None
+    assert "supervisor_agent" in workflow.get_graph().nodes
+
+    # Test routing function
+    test_state = create_initial_state("Test query")
+    test_state["next_agent"] = "policy_agent"
+    assert decide_next_agent(test_state) == "policy_agent"
+
+    # Test get_workflow singleton
+    assert get_workflow() is workflow
+
+
+@skip_observability
+def test_llm_client(llm_client):
+    """Test LLM client (without making actual API calls)."""
+    assert llm_client is not None
+    assert llm_client.model
+
+    # Test singleton
+    assert llm_client is get_llm_client()
+
+
+@skip_observability
+def test_metrics():
+    """Test metrics collection."""
+    assert metrics.api_requests_total is not None
+    assert metrics.agent_invocations_total is not None
+    assert metrics.llm_requests_total is not None
+
+    # Test incrementing a metric
+    metrics.agent_invocations_total.labels(agent_name="test_agent", status="success").inc()
+
+    # Test getting metrics output
+    metrics_output = metrics.get_metrics()
+    assert metrics_output is not None
+    assert len(metrics_output) > 0
@@ -0,0 +1,131 @@
+"""
+Fixtures shared by the unit tests.
+"""
+import sqlite3
+
+import pytest
+
+from src.database.connection import get_pooled_connection
+from src.tools import billing_tools, claims_tools, policy_tools
+
+# Tables as created by the notebook's setup_insurance_database()
+_SCHEMA = """
+    CREATE TABLE customers (
+        customer_id VARCHAR(20) PRIMARY KEY,
+        first_name VARCHAR(50),
+        last_name VARCHAR(50),
+        email VARCHAR(100),
+        phone VARCHAR(20),
+        date_of_birth DATE,
+        state VARCHAR(20)
+    );
+    CREATE TABLE policies (
+        policy_number VARCHAR(20) PRIMARY KEY,
+        customer_id VARCHAR(20),
+        policy_type VARCHAR(50),
+        start_date DATE,
+        premium_amount DECIMAL(10,2),
+        billing_frequency VARCHAR(20),
+        status VARCHAR(20)
+    );
+    CREATE TABLE auto_policy_details (
+        policy_number VARCHAR(20) PRIMARY KEY,
+        vehicle_vin VARCHAR(50),
+        vehicle_make VARCHAR(50),
+        vehicle_model VARCHAR(50),
+        vehicle_year INTEGER,
+        liability_limit DECIMAL(10,2),
+        collision_deductible DECIMAL(10,2),
+        comprehensive_deductible DECIMAL(10,2),
+        uninsured_motorist BOOLEAN,
+        rental_car_coverage BOOLEAN
+    );
+    CREATE TABLE billing (
+        bill_id VARCHAR(20) PRIMARY KEY,
+        policy_number VARCHAR(20),
+        billing_date DATE,
+        due_date DATE,
+        amount_due DECIMAL(10,2),
+        status VARCHAR(20)
+    );
+    CREATE TABLE payments (
+        payment_id VARCHAR(20) PRIMARY KEY,
+        bill_id VARCHAR(20),
+        payment_date DATE,
+        amount DECIMAL(10,2),
+        payment_method VARCHAR(50),
+        transaction_id VARCHAR(100),
+        status VARCHAR(20)
+    );
+    CREATE TABLE claims (
+        claim_id VARCHAR(20) PRIMARY KEY,
+        policy_number VARCHAR(20),
+        claim_date DATE,
+        incident_type VARCHAR(100),
+        estimated_loss DECIMAL(10,2),
+        status VARCHAR(20)
+    );
+"""
+
+# Number of seeded policies, POL000001 to POL000600; enough for several
+# IN (...) chunks
+SEEDED_POLICIES = 600
+
+
+@pytest.fixture
+def seeded_db(tmp_path, monkeypatch):
+    """
+    Point the database tools at a small seeded SQLite file.
+
+    POL000001 is an auto policy with auto details and four claims,
+    POL000002 is a home policy with one claim, and the remaining policies
+    are home policies without claims. Tool caches are cleared so earlier
+    lookups do not leak in.
+    """
+    db_path = str(tmp_path / "insurance_support.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_SCHEMA)
+    conn.execute(
+        "INSERT INTO customers VALUES ('CUST00001', 'Ann', 'Lee', 'ann@example.com', '555-0100', '1980-01-01', 'CA')"
+    )
+    conn.executemany(
+        "INSERT INTO policies VALUES (?, 'CUST00001', ?, '2023-01-01', ?, 'monthly', 'active')",
+        [
+            (f"POL{i:06d}", "auto" if i == 1 else "home", 100.0 + i)
+            for i in range(1, SEEDED_POLICIES + 1)
+        ],
+    )
+    conn.execute(
+        "INSERT INTO auto_policy_details VALUES "
+        "('POL000001', 'VIN00000000000000001', 'Honda', 'Civic', 2020, 100000, 500, 250, 1, 0)"
+    )
+    conn.executemany(
+        "INSERT INTO claims VALUES (?, ?, ?, 'collision', 1000, 'open')",
+        [
+            ("CLM000001", "POL000001", "2024-01-05"),
+            ("CLM000002", "POL000001", "2024-03-10"),
+            ("CLM000003", "POL000001", "2024-02-20"),
+            ("CLM000004", "POL000001", "2023-12-01"),
+            ("CLM000005", "POL000002", "2024-04-01"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    for module in (billing_tools, claims_tools, policy_tools):
+        monkeypatch.setattr(module, "get_pooled_connection", lambda: get_pooled_connection(db_path))
+
+    caches = [
+        lookup.cache
+        for lookup in (
+            policy_tools.get_policy_details,
+            policy_tools.get_auto_policy_details,
+            policy_tools.get_full_auto_policy,
+        )
+        if hasattr(lookup, "cache")
+    ]
+    for cache in caches:
+        cache.clear()
+    yield db_path
+    for cache in caches:
+        cache.clear()
@@ -0,0 +1,21 @@
+"""
+Tests for the claims tools (src/tools/claims_tools.py) against a seeded
+database.
+"""
+from src.tools.claims_tools import get_claims_by_policies
+
+
+def test_get_claims_by_policies(seeded_db):
+    """Test latest three claims per policy, newest first, and empty lists."""
+    results = get_claims_by_policies(["POL000003", "POL000001", "POL000002", "POL000001"])
+
+    assert list(results) == ["POL000003", "POL000001", "POL000002"]
+    assert [claim["claim_id"] for claim in results["POL000001"]] == ["CLM000002", "CLM000003", "CLM000001"]
+    assert [claim["claim_id"] for claim in results["POL000002"]] == ["CLM000005"]
+    assert results["POL000003"] == []
+    assert all("_rank" not in claim for claims in results.values() for claim in claims)
+
+
+def test_get_claims_by_policies_rejects_malformed_numbers(seeded_db):
+    """Test malformed policy numbers are rejected before querying."""
+    assert get_claims_by_policies(["POL000001", "N/A"]) == {"error": "Invalid policy number: N/A"}
@@ -0,0 +1,59 @@
+"""
+Tests for database setup (src/database/connection.py).
+"""
+import sqlite3
+
+from src.database.connection import DatabaseManager, get_pooled_connection
+
+
+def _index_names(db_path):
+    """List the index names in a database file."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    finally:
+        conn.close()
+
+
+def test_prepare_for_queries_creates_indexes(tmp_path):
+    """Test startup preparation creates the tool query indexes and WAL."""
+    db_path = str(tmp_path / "insurance.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE policies (policy_number TEXT PRIMARY KEY, customer_id TEXT);
+        CREATE TABLE billing (bill_id TEXT PRIMARY KEY, policy_number TEXT, status TEXT, due_date TEXT);
+        CREATE TABLE payments (payment_id TEXT PRIMARY KEY, bill_id TEXT, payment_date TEXT);
+        CREATE TABLE claims (claim_id TEXT PRIMARY KEY, policy_number TEXT, claim_date TEXT);
+        """
+    )
+    conn.close()
+
+    manager = DatabaseManager(db_path)
+    try:
+        assert manager.prepare_for_queries()
+        assert manager.connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        manager.close()
+
+    assert {
+        "idx_policies_customer_id",
+        "idx_billing_policy_status_due",
+        "idx_payments_bill_date",
+        "idx_claims_policy_date",
+    } <= _index_names(db_path)
+
+
+def test_pooled_connection_does_not_change_schema(tmp_path):
+    """Test read connections leave an unprepared database untouched."""
+    db_path = str(tmp_path / "empty.db")
+
+    get_pooled_connection(db_path).execute("SELECT 1")
+
+    assert _index_names(db_path) == set()
+    manager = DatabaseManager(db_path)
+    try:
+        # Tables are missing, so preparation reports failure instead of raising
+        assert not manager.prepare_for_queries()
+    finally:
+        manager.close()
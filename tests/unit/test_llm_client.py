@@ -0,0 +1,132 @@
+"""
+Tests for the LLM client wrapper (src/utils/llm_client.py) with a stubbed
+OpenAI client.
+"""
+import contextvars
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from cachetools import TTLCache
+from openai.types.chat import ChatCompletion
+
+from src.utils import llm_client as llm_client_module
+
+
+class _StubCompletions:
+    """Stands in for ``OpenAI().chat.completions``, replaying responses."""
+
+    def __init__(self, *messages):
+        self.messages = list(messages)
+        self.requests = []
+
+    def create(self, **request):
+        self.requests.append(request)
+        message = self.messages.pop(0) if len(self.messages) > 1 else self.messages[0]
+        return ChatCompletion.model_validate({
+            "id": f"chatcmpl-{len(self.requests)}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": request["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", **message}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        })
+
+
+@pytest.fixture
+def stub_completions(llm_client, monkeypatch):
+    """Route the global client's requests to a stub with an empty response cache."""
+    monkeypatch.setattr(llm_client_module, "_response_cache", TTLCache(maxsize=16, ttl=60))
+
+    def install(*messages):
+        completions = _StubCompletions(*messages)
+        monkeypatch.setattr(llm_client, "client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+        return completions
+
+    return install
+
+
+def test_complete_cache_hit_returns_private_copy(llm_client, stub_completions):
+    """Test a cached message is served again and cannot be changed by callers."""
+    completions = stub_completions({"content": "Your policy is active."})
+
+    first = llm_client.complete("Is POL000001 active?", temperature=0)
+    first.content = "changed by caller"
+    second = llm_client.complete("Is POL000001 active?", temperature=0)
+    second.content = "changed again"
+    third = llm_client.complete("Is POL000001 active?", temperature=0)
+
+    assert len(completions.requests) == 1
+    assert third.content == "Your policy is active."
+    assert third is not second
+
+
+def test_complete_cache_miss_on_different_request(llm_client, stub_completions):
+    """Test requests with different prompts are not served from each other."""
+    completions = stub_completions({"content": "first"}, {"content": "second"})
+
+    assert llm_client.complete("prompt one", temperature=0).content == "first"
+    assert llm_client.complete("prompt two", temperature=0).content == "second"
+    assert len(completions.requests) == 2
+
+
+@pytest.mark.parametrize("call", ["complete", "run_llm"])
+def test_cache_only_used_at_temperature_zero(llm_client, stub_completions, call):
+    """Test sampled requests always reach the model."""
+    completions = stub_completions({"content": "answer"})
+
+    for _ in range(2):
+        getattr(llm_client, call)("same prompt", temperature=0.7)
+
+    assert len(completions.requests) == 2
+
+
+def test_run_llm_caches_deterministic_answers(llm_client, stub_completions):
+    """Test tool-free temperature-0 run_llm answers are cached, tool runs are not."""
+    completions = stub_completions({"content": "answer"})
+    tools = [{"type": "function", "function": {"name": "noop", "parameters": {"type": "object"}}}]
+
+    assert llm_client.run_llm("same prompt", temperature=0) == "answer"
+    assert llm_client.run_llm("same prompt", temperature=0) == "answer"
+    assert len(completions.requests) == 1
+
+    llm_client.run_llm("same prompt", tools=tools, temperature=0)
+    llm_client.run_llm("same prompt", tools=tools, temperature=0)
+    assert len(completions.requests) == 3
+
+
+_REQUEST_TAG = contextvars.ContextVar("request_tag", default=None)
+
+
+def test_run_llm_runs_tool_calls_concurrently(llm_client, stub_completions):
+    """Test parallel tool calls keep their order, contain errors and see contextvars."""
+    tool_calls = [
+        {"id": "call_slow", "type": "function", "function": {"name": "slow", "arguments": '{"value": 1}'}},
+        {"id": "call_fail", "type": "function", "function": {"name": "fail", "arguments": "{}"}},
+    ]
+    completions = stub_completions({"content": None, "tool_calls": tool_calls}, {"content": "done"})
+    threads = []
+
+    def slow(value):
+        # Finishes after the failing call, so results arrive out of order
+        time.sleep(0.05)
+        threads.append(threading.current_thread().name)
+        return {"value": value, "tag": _REQUEST_TAG.get()}
+
+    def fail():
+        threads.append(threading.current_thread().name)
+        raise RuntimeError("lookup failed")
+
+    token = _REQUEST_TAG.set("request-1")
+    try:
+        assert llm_client.run_llm("prompt", tool_functions={"slow": slow, "fail": fail}) == "done"
+    finally:
+        _REQUEST_TAG.reset(token)
+
+    followup = completions.requests[1]["messages"]
+    assert [message.get("tool_call_id") for message in followup[2:]] == ["call_slow", "call_fail"]
+    assert json.loads(followup[2]["content"]) == {"value": 1, "tag": "request-1"}
+    assert json.loads(followup[3]["content"]) == {"error": "lookup failed"}
+    assert all(name.startswith("llm-tool") for name in threads)
@@ -0,0 +1,33 @@
+"""
+Tests for the API metrics middleware (src/observability/metrics.py).
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.observability.metrics import MetricsMiddleware
+
+
+def test_in_progress_gauge_keyed_by_route_template():
+    """Test requests for different path parameters share one gauge child."""
+    app = FastAPI()
+
+    @app.get("/sessions/{session_id}")
+    async def read_session(session_id: str):
+        return {"session_id": session_id}
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+
+    for session_id in ("a", "b", "c"):
+        assert client.get(f"/sessions/{session_id}").status_code == 200
+    assert client.post("/sessions/a").status_code == 405
+    assert client.get("/missing/path").status_code == 404
+
+    middleware = client.app.middleware_stack
+    while not isinstance(middleware, MetricsMiddleware):
+        middleware = middleware.app
+    assert set(middleware._in_progress) == {
+        ("GET", "/sessions/{session_id}"),
+        ("POST", "/sessions/{session_id}"),
+        ("GET", "unmatched"),
+    }
@@ -0,0 +1,50 @@
+"""
+Tests for the policy tools (src/tools/policy_tools.py) against a seeded
+database.
+"""
+from src.tools.policy_tools import (
+    get_auto_policy_details,
+    get_full_auto_policy,
+    get_policy_details,
+    get_policy_details_many,
+)
+from tests.unit.conftest import SEEDED_POLICIES
+
+
+def test_get_policy_details_many_across_chunks(seeded_db):
+    """Test more policies than fit in one IN (...) list, plus a missing one."""
+    requested = [f"POL{i:06d}" for i in range(SEEDED_POLICIES, 0, -1)] + ["POL999999", "POL000001"]
+
+    results = get_policy_details_many(requested)
+
+    assert list(results) == requested[:-1]
+    assert results["POL999999"] == {"error": "Policy not found"}
+    assert results["POL000600"]["premium_amount"] == 700.0
+    assert results["POL000001"]["policy_type"] == "auto"
+    assert results["POL000001"]["first_name"] == "Ann"
+    assert all("error" not in results[pn] for pn in requested[:SEEDED_POLICIES])
+
+
+def test_get_policy_details_many_rejects_malformed_numbers(seeded_db):
+    """Test malformed policy numbers are rejected before querying."""
+    assert get_policy_details_many(["POL000001", "unknown"]) == {"error": "Invalid policy number: unknown"}
+    assert get_policy_details_many([]) == {}
+
+
+def test_get_full_auto_policy_matches_single_lookups(seeded_db):
+    """Test the joined lookup returns what the two single lookups return."""
+    result = get_full_auto_policy("POL000001")
+
+    assert result["policy"] == get_policy_details("POL000001")
+    assert result["auto_details"] == get_auto_policy_details("POL000001")
+    assert result["auto_details"]["vehicle_make"] == "Honda"
+
+
+def test_get_full_auto_policy_without_auto_details(seeded_db):
+    """Test a non-auto policy keeps its policy columns despite NULL auto columns."""
+    result = get_full_auto_policy("POL000002")
+
+    assert result["policy"] == get_policy_details("POL000002")
+    assert result["policy"]["policy_number"] == "POL000002"
+    assert result["auto_details"] == {"error": "Auto policy details not found"}
+    assert get_full_auto_policy("POL999999") == {"error": "Policy not found"}
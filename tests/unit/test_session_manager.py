@@ -0,0 +1,167 @@
+"""
+Tests for Redis session storage (src/session/manager.py), run against fakeredis.
+"""
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.session import manager as session_manager
+from src.session.models import MessageRole, SessionState
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _update_count(status: str) -> float:
+    """Current value of the session update counter for a status."""
+    return REGISTRY.get_sample_value(
+        "session_operations_total", {"operation": "update", "status": status}
+    ) or 0.0
+
+
+class _FailOnceRedis:
+    """Redis wrapper whose next pipeline fails to execute."""
+
+    def __init__(self, redis, release: threading.Event = None):
+        self._redis = redis
+        self.fail_next = True
+        # When given, the failing pipeline waits for it before being built
+        self.started = threading.Event()
+        self._release = release
+
+    def pipeline(self, **kwargs):
+        if self.fail_next and self._release is not None:
+            self.started.set()
+            self._release.wait(5)
+        pipe = self._redis.pipeline(**kwargs)
+        if self.fail_next:
+            self.fail_next = False
+
+            def execute(*args, **kwargs):
+                raise session_manager.RedisError("simulated write failure")
+
+            pipe.execute = execute
+        return pipe
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    """Build SessionManagers backed by a fresh in-process fake Redis server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        session_manager,
+        "get_connection_pool",
+        lambda url: fakeredis.FakeRedis(server=server).connection_pool,
+    )
+
+    def make(write_behind: bool = False) -> session_manager.SessionManager:
+        monkeypatch.setattr(session_manager.settings, "SESSION_WRITE_BEHIND_ENABLED", write_behind)
+        return session_manager.SessionManager(redis_url="redis://fake")
+
+    return make
+
+
+def test_write_behind_failure_rewrites(make_manager):
+    """Test a failed buffered write is rewritten and later updates build on it."""
+    manager = make_manager(write_behind=True)
+    session = manager.create_session("write-behind-test")
+    manager._write_buffer._redis = _FailOnceRedis(manager._write_buffer._redis)
+
+    session.add_message(role=MessageRole.USER, content="first")
+    session.context.customer_id = "CUST00001"
+    manager.update_session(session)
+    assert manager.flush_writes(timeout=5)
+    # The failed write was repaired by a full rewrite
+    assert [m.content for m in manager.get_session("write-behind-test").messages] == ["first"]
+
+    session.add_message(role=MessageRole.ASSISTANT, content="second")
+    manager.update_session(session)
+    assert manager.flush_writes(timeout=5)
+
+    stored = manager.get_session("write-behind-test")
+    assert [m.content for m in stored.messages] == ["first", "second"]
+    assert stored.context.customer_id == "CUST00001"
+
+
+def test_write_behind_failure_repairs_queued_delta(make_manager):
+    """Test a delta queued before an earlier write fails is repaired."""
+    manager = make_manager(write_behind=True)
+    session = manager.create_session("write-behind-queued")
+    ok_before, err_before = _update_count("success"), _update_count("error")
+    release = threading.Event()
+    failing = _FailOnceRedis(manager._write_buffer._redis, release=release)
+    manager._write_buffer._redis = failing
+
+    session.add_message(role=MessageRole.USER, content="first")
+    session.context.customer_id = "CUST00001"
+    manager.update_session(session)
+    assert failing.started.wait(5)
+
+    # Queued while the first write is in flight: a delta with only "second"
+    session.add_message(role=MessageRole.ASSISTANT, content="second")
+    manager.update_session(session)
+
+    release.set()
+    assert manager.flush_writes(timeout=5)
+
+    stored = manager.get_session("write-behind-queued")
+    assert [m.content for m in stored.messages] == ["first", "second"]
+    assert stored.context.customer_id == "CUST00001"
+
+    # Only sent writes count as successes: the second update and the repair
+    assert _update_count("error") - err_before == 1
+    assert _update_count("success") - ok_before == 2
+
+
+class _StalledRedis:
+    """Redis wrapper whose pipelines wait for an event before being built."""
+
+    def __init__(self, redis, release: threading.Event):
+        self._redis = redis
+        self._release = release
+
+    def pipeline(self, **kwargs):
+        self._release.wait(5)
+        return self._redis.pipeline(**kwargs)
+
+
+@pytest.mark.parametrize("operation", ["list_sessions", "refresh_ttl"])
+def test_reads_wait_for_buffered_writes(make_manager, operation):
+    """Test listing and TTL refresh see a session whose write is still queued."""
+    manager = make_manager(write_behind=True)
+    release = threading.Event()
+    manager._write_buffer._redis = _StalledRedis(manager._write_buffer._redis, release)
+
+    session = SessionState(session_id="buffered-only")
+    session.add_message(role=MessageRole.USER, content="hello")
+    manager.update_session(session)
+    threading.Timer(0.2, release.set).start()
+
+    if operation == "list_sessions":
+        assert "buffered-only" in manager.list_sessions()
+    else:
+        assert manager.refresh_ttl("buffered-only")
+
+
+def test_session_round_trip(make_manager):
+    """Test stored sessions read back with the same fields and timestamps."""
+    writer = make_manager()
+    session = writer.create_session("round-trip-test")
+    session.add_message(role=MessageRole.USER, content="Is my policy active?", metadata={"request_id": "r1"})
+    session.add_message(role=MessageRole.ASSISTANT, content="Yes, POL000001 is active.")
+    session.update_context(customer_id="CUST00001", policy_number="POL000001", entities={"state": "CA"})
+    session.metadata.agents_used.append("policy_agent")
+    session.graph_state = {"n_iteration": 2}
+    writer.update_session(session)
+    expected = session.to_dict()
+
+    # A second manager has an empty L1 cache, so it decodes what Redis holds
+    reader = make_manager()
+    loaded = reader.get_session("round-trip-test")
+    assert loaded.to_dict() == expected
+    assert loaded.created_at == session.created_at
+    assert loaded.last_activity == session.last_activity
+    assert [m.timestamp for m in loaded.messages] == [m.timestamp for m in session.messages]
+
+    assert reader.get_session_msg("round-trip-test") == session.to_msg()
+    assert SessionState.from_dict(expected).model_dump() == session.model_dump()
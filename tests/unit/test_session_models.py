@@ -0,0 +1,44 @@
+"""
+Tests for session models (src/session/models.py).
+"""
+from datetime import datetime, timedelta, timezone
+
+from src.session.models import MessageRole, SessionState, from_micros, to_micros
+
+
+def test_session_to_dict_after_replacing_messages():
+    """Test to_dict re-dumps messages that were replaced in place."""
+    session = SessionState(session_id="to-dict-test")
+    session.add_message(role=MessageRole.USER, content="first")
+    session.add_message(role=MessageRole.ASSISTANT, content="second")
+    session.to_dict()
+
+    session.messages[0] = session.messages[0].model_copy(update={"content": "edited"})
+    assert [m["content"] for m in session.to_dict()["messages"]] == ["edited", "second"]
+
+    replacement = SessionState(session_id="other")
+    for content in ("a", "b", "c"):
+        replacement.add_message(role=MessageRole.USER, content=content)
+    session.messages = replacement.messages
+    assert [m["content"] for m in session.to_dict()["messages"]] == ["a", "b", "c"]
+
+
+def test_conversation_history_labels():
+    """Test history rendering keeps system messages labelled as the assistant's."""
+    session = SessionState(session_id="history-test")
+    session.add_message(role=MessageRole.USER, content="Hi")
+    session.add_message(role=MessageRole.SYSTEM, content="Routed to billing")
+    session.add_message(role=MessageRole.ASSISTANT, content="Your bill is due")
+
+    assert session.get_conversation_history() == (
+        "User: Hi\nAssistant: Routed to billing\nAssistant: Your bill is due"
+    )
+
+
+def test_to_micros_accepts_aware_datetimes():
+    """Test aware datetimes convert to the same instant as naive UTC ones."""
+    naive = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    aware = naive.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=-5)))
+
+    assert to_micros(aware) == to_micros(naive)
+    assert from_micros(to_micros(aware)) == naive
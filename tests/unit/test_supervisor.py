@@ -0,0 +1,48 @@
+"""
+Tests for the supervisor's routing (src/agents/supervisor.py).
+"""
+import pytest
+
+from src.agents.supervisor import SupervisorAgent
+from src.graph.state import create_initial_state
+
+
+def test_fast_route_uses_new_policy_number(settings, monkeypatch):
+    """Test the fast route takes the policy number named in the new message."""
+    monkeypatch.setattr(settings, "SUPERVISOR_FAST_ROUTING", True)
+    state = create_initial_state(
+        user_input="When is the next payment due on POL000002?",
+        policy_number="POL000001",
+    )
+
+    result = SupervisorAgent().process(state)
+
+    assert result["next_agent"] == "billing_agent"
+    assert result["policy_number"] == "POL000002"
+    assert "POL000002" in result["task"]
+
+
+@pytest.mark.parametrize(
+    "user_input",
+    [
+        "I want to talk to a human about my claim on POL000001",
+        "cancel my policy POL000001 coverage",
+        "complaint about billing on POL000001",
+        "Please escalate my claim for POL000001 to a manager",
+    ],
+)
+def test_fast_route_skips_escalation_requests(settings, monkeypatch, user_input):
+    """Test escalation-style requests fall through to the LLM router."""
+    monkeypatch.setattr(settings, "SUPERVISOR_FAST_ROUTING", True)
+    routed = {}
+
+    def route_request(self, state, n_iter):
+        routed["n_iter"] = n_iter
+        return {"next_agent": "human_escalation_agent", "n_iteration": n_iter}
+
+    monkeypatch.setattr(SupervisorAgent, "_route_request", route_request)
+
+    result = SupervisorAgent().process(create_initial_state(user_input=user_input))
+
+    assert routed == {"n_iter": 1}
+    assert result["next_agent"] == "human_escalation_agent"
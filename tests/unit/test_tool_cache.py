@@ -0,0 +1,34 @@
+"""
+Tests for memoized tool lookups (src/tools/cache.py).
+"""
+import pytest
+from cachetools.keys import hashkey
+
+from src.tools.cache import ttl_memoize
+from src.tools.policy_tools import get_policy_details, invalidate_policy
+
+
+def test_invalidate_policy():
+    """Test cached policy lookups can be invalidated."""
+    cache = getattr(get_policy_details, "cache", None)
+    if cache is None:
+        pytest.skip("Tool caching is disabled")
+
+    cache[hashkey("POL999998")] = {"policy_number": "POL999998"}
+    cache[hashkey(policy_number="POL999998")] = {"policy_number": "POL999998"}
+    invalidate_policy("POL999998")
+    assert hashkey("POL999998") not in cache
+    assert hashkey(policy_number="POL999998") not in cache
+
+
+def test_ttl_memoize_isolates_nested_results(settings):
+    """Test mutating a memoized result does not change the cached value."""
+    if settings.TOOL_CACHE_TTL_SECONDS <= 0:
+        pytest.skip("Tool caching is disabled")
+
+    @ttl_memoize("test")
+    def lookup(policy_number):
+        return {"policy": {"policy_number": policy_number}, "auto_details": {"deductible": 500}}
+
+    lookup("POL000001")["auto_details"]["deductible"] = 0
+    assert lookup("POL000001")["auto_details"]["deductible"] == 500
@@ -0,0 +1,68 @@
+"""
+Tests for clarification questions (src/tools/user_interaction.py).
+"""
+import threading
+import time
+
+import pytest
+
+from src.tools import user_interaction
+
+
+def test_clarification_through_redis(monkeypatch):
+    """Test a clarification question can be answered through Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(user_interaction, "_redis", fakeredis.FakeRedis())
+
+    assert not user_interaction.submit_clarification("clarify-test", "too early")
+
+    result = {}
+    waiter = threading.Thread(
+        target=lambda: result.update(
+            user_interaction._ask_user_redis(
+                user_interaction._redis, "clarify-test", "Policy number?", "policy_number", timeout=5
+            )
+        )
+    )
+    waiter.start()
+
+    deadline = time.monotonic() + 5
+    while user_interaction.get_pending_clarification("clarify-test") is None:
+        assert time.monotonic() < deadline, "question was never published"
+        time.sleep(0.01)
+
+    pending = user_interaction.get_pending_clarification("clarify-test")
+    assert pending.question == "Policy number?"
+    assert pending.missing_info == "policy_number"
+
+    assert user_interaction.submit_clarification("clarify-test", "POL000004")
+    waiter.join(timeout=5)
+    assert result["context"] == "POL000004"
+    assert user_interaction.get_pending_clarification("clarify-test") is None
+
+
+def test_redis_check_retries_after_failure(monkeypatch):
+    """Test a failed Redis check is retried after a backoff instead of cached."""
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(user_interaction, "_redis", None)
+    monkeypatch.setattr(user_interaction, "_redis_retry_at", 0.0)
+    monkeypatch.setattr(user_interaction, "_redis_backoff", 0.0)
+
+    server = fakeredis.FakeServer()
+    server.connected = False
+    attempts = []
+
+    def get_connection_pool(url, **kwargs):
+        attempts.append(kwargs["purpose"])
+        return fakeredis.FakeRedis(server=server).connection_pool
+
+    monkeypatch.setattr(user_interaction, "get_connection_pool", get_connection_pool)
+
+    assert user_interaction._get_redis() is None
+    assert user_interaction._get_redis() is None  # within the backoff window
+    assert attempts == ["clarifications"]
+
+    server.connected = True
+    monkeypatch.setattr(user_interaction, "_redis_retry_at", 0.0)
+    assert user_interaction._get_redis() is not None
+    assert len(attempts) == 2